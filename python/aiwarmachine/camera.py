@@ -20,9 +20,7 @@ Once the Camera is initialized, simply call start() to start its CameraFeed.
 You can then call get_frame() to get the latest frame available.
 """
 
-import copy
 import time
-import json
 import re
 
 from PyQt6 import QtCore
@@ -41,8 +39,10 @@ def load_camera_data(filepath):
     :return: Camera data.
     :rtype: dict
     """
+    # Cameras are only loaded and saved occasionally, no need to pay for json at import time
+    import json
     with open(filepath, 'r') as fid:
-        camera_data = json.loads(fid.read())
+        camera_data = json.load(fid)
 
     camera_data['capture_properties_dict'] = {int(_k): _v for _k, _v in camera_data['capture_properties_dict'].items()}
     camera_data['mtx'] = np.array(camera_data['mtx'], np.float32) if camera_data['mtx'] is not None else None
@@ -125,21 +125,34 @@ class Camera(QtCore.QObject):
         self._roi = roi
         self._tvec = tvec
         self._rvec = rvec
+        # Undistorted projection matrix, computed from the calibration and pose when first needed
+        self._undistorted_projection_matrix = None
 
         # camera feed
         self._device_id = device_id
         if capture_properties_dict is None:
-            capture_properties_dict = copy.deepcopy(constants.DEFAULT_CAPTURE_PROPERTIES_DICT)
+            capture_properties_dict = constants.DEFAULT_CAPTURE_PROPERTIES_DICT.copy()
         self._capture_properties_dict = capture_properties_dict
         self._camera_feed = camera_feed.CameraFeed(self, debug=self.debug)
-        self._camera_feed.frame_grabbed.connect(self.new_frame)
+        # Direct connection so frames are stored from the feed thread instead of being
+        # queued in the GUI event loop, get_frame() then simply fetches the latest one.
+        self._camera_feed.frame_grabbed.connect(self.new_frame, QtCore.Qt.ConnectionType.DirectConnection)
 
         self.recalculate_undistort_mapping()
 
+        # Undistorted frames alternate between these buffers so the previous one stays valid while the next is written
+        self._undistort_buffers_list = [None, None]
+        self._undistort_buffer_index = 0
+        # OpenCL copies of the undistort mapping, along with the mapping they were made from
+        self._undistort_umaps = (None, None, None)
+        # CUDA copies of the undistort mapping, along with the mapping they were made from, and the reused frame upload buffer
+        self._undistort_gpu_maps = (None, None, None)
+        self._undistort_gpu_frame = None
+
         # frame buffer
         self._reset_framebuffer()
 
-        self._previous_time = time.time()
+        self._previous_time_ns = time.perf_counter_ns()
         self.current_fps = 0.0
 
         self._effective_resolution = [None, None]
@@ -151,19 +164,35 @@ class Camera(QtCore.QObject):
                 self._capture_properties_dict.get(common.get_capture_property_id("Width"), constants.DEFAULT_CAPTURE_WIDTH),
                 self._capture_properties_dict.get(common.get_capture_property_id("Height"), constants.DEFAULT_CAPTURE_HEIGHT)
             )
-            self._mapx, self._mapy = cv.initUndistortRectifyMap(self._mtx, self._dist, None, self._mtx_prime, image_resolution, 5)
+            self._set_undistort_mapping(image_resolution)
         else:
             self._mapx = None
             self._mapy = None
 
+    def _set_undistort_mapping(self, image_resolution):
+        """Compute the undistort mapping of the valid ROI from the current calibration.
+
+        :param image_resolution: The capture resolution as (width, height).
+        :type image_resolution: tuple[int, int]
+        """
+        mapx, mapy = cv.initUndistortRectifyMap(self._mtx, self._dist, None, self._mtx_prime, image_resolution, constants.UNDISTORT_MAP_TYPE)
+        # Only map the ROI pixels so remapping directly outputs the cropped frame, pixels outside of it are never computed
+        x, y, w, h = self._roi
+        self._mapx = np.ascontiguousarray(mapx[y:y + h, x:x + w])
+        self._mapy = np.ascontiguousarray(mapy[y:y + h, x:x + w])
+
     def _reset_framebuffer(self):
-        """Reset the framebuffer and framebuffer index."""
-        self._framebuffer_list = [None, None, None]
-        self._framebuffer_index = -1
+        """Reset the framebuffer."""
+        # Every grabbed frame is a new array, so publishing the latest one is a single reference assignment,
+        # which is atomic and needs no lock, readers always get a fully written frame
+        self._latest_frame = None
+        # Resolution of the latest frame along with its text, only rebuilt when the resolution changes
+        self._latest_shape = None
+        self._latest_resolution_str = None
 
     def start(self):
         """Start the camera feed."""
-        self._previous_time = time.time()
+        self._previous_time_ns = time.perf_counter_ns()
         self._camera_feed.start()
 
     def stop(self):
@@ -180,66 +209,47 @@ class Camera(QtCore.QObject):
     def new_frame(self, frame, valid_frame):
         """Frame received from camera feed.
 
+        .. note:: This is called from the camera feed thread.
+
         :param frame: The frame.
         :type frame: :class:`numpy.ndarray`
 
         :param valid_frame: Whether or not this frame is valid.
         :type valid_frame: bool
         """
-        time_delay = time.time() - self._previous_time
-        self.current_fps = 1.0 / max(0.0001, time_delay)
-
-        buffer_id = (self._framebuffer_index + 1) % 3
-        self._framebuffer_list[buffer_id] = frame
-        self._framebuffer_index = buffer_id
-
-        self._previous_time = time.time()
-        if valid_frame:
+        # Monotonic and cheaper than the wall clock, smoothed so a single late frame doesn't make the fps jump
+        current_time_ns = time.perf_counter_ns()
+        frame_fps = 1e9 / max(100000, current_time_ns - self._previous_time_ns)
+        self._previous_time_ns = current_time_ns
+        self.current_fps += constants.FPS_EMA_FACTOR * (frame_fps - self.current_fps)
+
+        shape = frame.shape
+        if shape != self._latest_shape:
+            self._latest_resolution_str = f'{shape[1]}x{shape[0]}'
+            self._latest_shape = shape
+        self._latest_frame = frame
+
+        if valid_frame and (self._effective_resolution[0] != shape[1] or self._effective_resolution[1] != shape[0]):
             # update actual capture resolution
-            self._effective_resolution = [frame.shape[1], frame.shape[0]]
+            self._effective_resolution = [shape[1], shape[0]]
 
-    def get_frame(self, show_info=False, return_info=False):
+    def get_frame(self, return_info=False):
         """Get the latest frame available.
 
-        :param show_info: Print resolution and fps on the image. (False)
-        :type show_info: bool
-
         :param return_info: If set to True, will also return info string "{width}x{height} @ {fps}fps" along with the frame as a tuple. (False)
         :type return_info: bool
 
         :return: The frame.
         :rtype: :class:`numpy.ndarray`
         """
-        if self._framebuffer_index >= 0:
-            frame = self._framebuffer_list[self._framebuffer_index]
-            info_str = f'{frame.shape[1]}x{frame.shape[0]} @ {self.current_fps:0.1f}fps'
-            if show_info:
-                info_frame = cv.putText(
-                    frame,
-                    info_str,
-                    (50, 50),
-                    cv.FONT_HERSHEY_SIMPLEX,
-                    1,
-                    (255, 255, 255),
-                    2,
-                    cv.LINE_AA
-                )
-                if return_info:
-                    return info_frame, info_str
-                else:
-                    return info_frame
-
-            elif return_info:
-                return frame, info_str
-
-            else:
-                return frame
-
-        elif return_info:
+        frame = self._latest_frame
+        if not return_info:
+            return frame
+
+        if frame is None:
             return None, None
 
-        else:
-            return None
+        return frame, f'{self._latest_resolution_str} @ {self.current_fps:0.1f}fps'
 
     @property
     def device_id(self):
@@ -272,7 +282,9 @@ class Camera(QtCore.QObject):
         :return: Capture properties.
         :rtype: dict
         """
-        return copy.deepcopy(self._capture_properties_dict)
+        # Properties are flat int to scalar values, a shallow copy is enough and it's done in a single C call,
+        # which matters since the camera feed thread asks for a copy every frame
+        return self._capture_properties_dict.copy()
 
     def set_capture_property(self, property_id, value):
         """Set a capture property.
@@ -283,7 +295,18 @@ class Camera(QtCore.QObject):
         :param value: Value.
         :type value: any
         """
-        self._capture_properties_dict[property_id] = value
+        self.set_capture_properties({property_id: value})
+
+    def set_capture_properties(self, properties_dict):
+        """Set multiple capture properties at once.
+
+            The camera feed thread compares properties on every frame, a new dict is published in a single assignment
+            so it always sees all these changes together and applies them in the same pass.
+
+        :param properties_dict: Values by cv.VideoCaptureProperties enum value.
+        :type properties_dict: dict
+        """
+        self._capture_properties_dict = {**self._capture_properties_dict, **properties_dict}
 
     def get_capture_property(self, property_id):
         """Get a capture property.
@@ -343,31 +366,65 @@ class Camera(QtCore.QObject):
         :param image_resolution: The image resolution as (width, height).
         :type image_resolution: tupple of int
 
-        :return: Mean reprojection error.
+        :return: Root mean square reprojection error.
         :rtype: float
         """
-        ret, mtx, dist, rvecs_list, tvecs_list = cv.calibrateCamera(
+        mtx, dist, rms_error = self.compute_calibration(checkerboard_3d_points_3_list, checkerboard_2d_points_3_list, image_resolution)
+        self.set_calibration(mtx, dist, image_resolution)
+        return rms_error
+
+    @staticmethod
+    def compute_calibration(checkerboard_3d_points_3_list, checkerboard_2d_points_3_list, image_resolution):
+        """Calculate the camera matrix and distortion coefficients without setting them.
+
+            This doesn't touch any camera, so it can safely run in a different thread.
+
+        :param checkerboard_3d_points_3_list: Three lists (one for each calibration view) of array of 3d points.
+        :type checkerboard_3d_points_3_list: list of :class:`numpy.ndarray`
+
+        :param checkerboard_2d_points_3_list: Three lists (one for each calibration view) of array of corresponding 2d points.
+        :type checkerboard_2d_points_3_list: list of :class:`numpy.ndarray`
+
+        :param image_resolution: The image resolution as (width, height).
+        :type image_resolution: tupple of int
+
+        :return: Camera matrix, distortion coefficients and root mean square reprojection error.
+        :rtype: tuple[:class:`numpy.ndarray`, :class:`numpy.ndarray`, float]
+
+        :raise: RuntimeError if the calibration failed.
+        """
+        ret, mtx, dist, _, _ = cv.calibrateCamera(
             checkerboard_3d_points_3_list,
             checkerboard_2d_points_3_list,
             image_resolution,
             None,
-            None
+            None,
+            flags=constants.CAMERA_CALIBRATION_FLAGS
         )
 
         if not ret:
             raise RuntimeError("Unable to calibrate camera with these images.")
 
+        # calibrateCamera already returns the RMS reprojection error over all the views points
+        return mtx, dist, ret
+
+    def set_calibration(self, mtx, dist, image_resolution):
+        """Set the camera matrix and distortion coefficients, then update ROI and mapping function to undistort images.
+
+        :param mtx: The camera matrix.
+        :type mtx: :class:`numpy.ndarray`
+
+        :param dist: The distortion coefficients.
+        :type dist: :class:`numpy.ndarray`
+
+        :param image_resolution: The image resolution as (width, height).
+        :type image_resolution: tupple of int
+        """
         self._mtx = mtx
         self._dist = dist
+        self._undistorted_projection_matrix = None
         self._mtx_prime, self._roi = cv.getOptimalNewCameraMatrix(self._mtx, self._dist, image_resolution, 1, image_resolution)
-        self._mapx, self._mapy = cv.initUndistortRectifyMap(self._mtx, self._dist, None, self._mtx_prime, image_resolution, 5)
-        mean_error = 0
-        for i in range(len(checkerboard_3d_points_3_list)):
-            projected_2d_points_array, _ = cv.projectPoints(checkerboard_3d_points_3_list[i], rvecs_list[i], tvecs_list[i], self._mtx, self._dist)
-            error = cv.norm(checkerboard_2d_points_3_list[i], projected_2d_points_array, cv.NORM_L2) / len(projected_2d_points_array)
-            mean_error += error
-
-        return mean_error / len(checkerboard_3d_points_3_list)
+        self._set_undistort_mapping(image_resolution)
 
     def undistort(self, frame, interpolation="Linear"):
         """Undistort image.
@@ -377,10 +434,50 @@ class Camera(QtCore.QObject):
 
         :param interpolation: Interpolation method in ['Nearest', 'Linear', 'Cubic', 'Lanczos4']. ('Linear')
         :type interpolation: int
+
+        :return: The undistorted image cropped to the valid ROI.
+        :rtype: :class:`numpy.ndarray`
+
+            .. note:: Without OpenCL or CUDA, the returned image is written in a reused buffer
+                and is only valid until the second following call, copy it to keep it longer.
         """
-        dst = cv.remap(frame, self._mapx, self._mapy, constants.INTERPOLATION_METHOD_NAME_DICT.get(interpolation, cv.INTER_LINEAR))
-        x, y, w, h = self._roi
-        return dst[y:y + h, x:x + w].copy()
+        interpolation_method = constants.INTERPOLATION_METHOD_NAME_DICT.get(interpolation, cv.INTER_LINEAR)
+
+        # CUDA remap has no Lanczos interpolation, let those frames go through the other paths
+        if constants.USE_CUDA and interpolation_method != cv.INTER_LANCZOS4:
+            if self._undistort_gpu_maps[0] is not self._mapx:
+                # CUDA remap only takes float maps
+                mapx, mapy = cv.convertMaps(self._mapx, self._mapy, cv.CV_32FC1)
+                gpu_mapx = cv.cuda_GpuMat()
+                gpu_mapx.upload(mapx)
+                gpu_mapy = cv.cuda_GpuMat()
+                gpu_mapy.upload(mapy)
+                self._undistort_gpu_maps = (self._mapx, gpu_mapx, gpu_mapy)
+                self._undistort_gpu_frame = cv.cuda_GpuMat()
+            _, gpu_mapx, gpu_mapy = self._undistort_gpu_maps
+            # The upload reuses the device buffer as long as the frame size doesn't change
+            self._undistort_gpu_frame.upload(frame)
+            # Downloading the result gives a new array, no need for the reused buffers
+            return cv.cuda.remap(self._undistort_gpu_frame, gpu_mapx, gpu_mapy, interpolation_method).download()
+
+        if constants.USE_OPENCL:
+            if self._undistort_umaps[0] is not self._mapx:
+                self._undistort_umaps = (self._mapx, cv.UMat(self._mapx), cv.UMat(self._mapy))
+            _, umapx, umapy = self._undistort_umaps
+            # Downloading the result gives a new array, no need for the reused buffers
+            return cv.remap(cv.UMat(frame), umapx, umapy, interpolation_method).get()
+
+        self._undistort_buffer_index = 1 - self._undistort_buffer_index
+        # OpenCV reallocates the buffer if it's missing or doesn't fit the mapping anymore
+        dst = cv.remap(
+            frame,
+            self._mapx,
+            self._mapy,
+            interpolation_method,
+            dst=self._undistort_buffers_list[self._undistort_buffer_index]
+        )
+        self._undistort_buffers_list[self._undistort_buffer_index] = dst
+        return dst
 
     def pose(self, checkerboard_3d_points_list, checkerboard_2d_points_list):
         """Calculate the pose of the camera for a frame.
@@ -402,6 +499,24 @@ class Camera(QtCore.QObject):
 
         self._rvec = rvec
         self._tvec = tvec
+        self._undistorted_projection_matrix = None
+
+    def get_undistorted_projection_matrix(self):
+        """Get the matrix projecting 3d points into the undistorted image, cropped to the ROI.
+
+            It's computed from the calibration and pose only once, until one of them changes.
+
+        :return: The 3x4 projection matrix.
+        :rtype: :class:`numpy.ndarray`
+        """
+        if self._undistorted_projection_matrix is None:
+            rotation_matrix, _ = cv.Rodrigues(np.asarray(self._rvec, np.float64))
+            extrinsic_matrix = np.hstack([rotation_matrix, np.asarray(self._tvec, np.float64).reshape(3, 1)])
+            x, y, _, _ = self._roi
+            # Move the origin to the ROI corner
+            roi_matrix = np.array([[1, 0, -x], [0, 1, -y], [0, 0, 1]], np.float64)
+            self._undistorted_projection_matrix = roi_matrix @ np.asarray(self._mtx_prime, np.float64) @ extrinsic_matrix
+        return self._undistorted_projection_matrix
 
     def project_points(self, points_array, undistorted=False, as_integers=False):
         """Project 3d points into 2d image space.
@@ -415,22 +530,24 @@ class Camera(QtCore.QObject):
         :param as_integers: Whether or not to convert to int instead of float. (False)
         :type as_integers: bool
         """
-        projected_2d_points_array, _ = cv.projectPoints(
-            points_array,
-            self._rvec,
-            self._tvec,
-            self._mtx_prime if undistorted else self._mtx,
-            None if undistorted else self._dist
-        )
-
         if undistorted:
-            x, y, _, _ = self._roi
-            for index in range(len(projected_2d_points_array)):
-                projected_2d_points_array[index][0][0] -= x
-                projected_2d_points_array[index][0][1] -= y
+            # No distortion to apply, a single matrix product replaces cv.projectPoints
+            projection_matrix = self.get_undistorted_projection_matrix()
+            points_3d_array = np.asarray(points_array, np.float64).reshape(-1, 3)
+            projected_points_array = points_3d_array @ projection_matrix[:, :3].T + projection_matrix[:, 3]
+            projected_2d_points_array = (projected_points_array[:, :2] / projected_points_array[:, 2:]).reshape(-1, 1, 2)
+        else:
+            projected_2d_points_array, _ = cv.projectPoints(
+                points_array,
+                self._rvec,
+                self._tvec,
+                self._mtx,
+                self._dist
+            )
 
         if as_integers:
-            return (np.rint(projected_2d_points_array)).astype(int)
+            # The projected array is always a new one, round it in place to save a temporary
+            return np.rint(projected_2d_points_array, out=projected_2d_points_array).astype(int)
         else:
             return projected_2d_points_array
 
@@ -478,8 +595,9 @@ class Camera(QtCore.QObject):
             'tvec': self._tvec.tolist() if self._tvec is not None else None,
             'rvec': self._rvec.tolist() if self._rvec is not None else None,
         }
+        import json
         with open(filepath, 'w') as fid:
-            fid.write(json.dumps(data, indent=2))
+            json.dump(data, fid, indent=2)
 
     def load(self, camera_data, update_device_id=False):
         """Load the camera data into this one.
@@ -493,8 +611,7 @@ class Camera(QtCore.QObject):
         self.stop()
         self.name = camera_data['name']
         self.model_name = camera_data['model_name']
-        for property_id, property_value in camera_data['capture_properties_dict'].items():
-            self.set_capture_property(property_id, property_value)
+        self.set_capture_properties(camera_data['capture_properties_dict'])
 
         self._mtx = camera_data['mtx']
         self._dist = camera_data['dist']
@@ -502,6 +619,7 @@ class Camera(QtCore.QObject):
         self._roi = camera_data['roi']
         self._tvec = camera_data['tvec']
         self._rvec = camera_data['rvec']
+        self._undistorted_projection_matrix = None
         self.recalculate_undistort_mapping()
 
         if update_device_id:
@@ -532,5 +650,6 @@ class Camera(QtCore.QObject):
         self._roi = None
         self._tvec = None
         self._rvec = None
+        self._undistorted_projection_matrix = None
         self.recalculate_undistort_mapping()
         self.start()
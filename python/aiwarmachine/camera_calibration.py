@@ -16,20 +16,175 @@
 #
 """Module to help calibrate a camera."""
 
+import collections
+import functools
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+
 from PyQt6 import QtCore, QtGui
 import cv2 as cv
 import numpy as np
 
-from . import constants
+from . import constants, common
 
 
-class CameraCalibrationHelper(QtCore.QObject):
-    """Helper class for camera calibration."""
+@functools.lru_cache(maxsize=8)
+def _build_checkerboard_3d_reference_points(dim_x, dim_y):
+    """Build checkboard 3D reference points for a number of inner corners.
+
+    .. note:: The returned array is shared between calls and is read-only.
+
+    :param dim_x: The number of inner corners on the checkerboard's width direction.
+    :type dim_x: int
+
+    :param dim_y: The number of inner corners on the checkerboard's height direction.
+    :type dim_y: int
+
+    :return: Array of reference points of shape (N, 3), rows go from top to bottom.
+    :rtype: :class:`np.ndarray`
+
+        .. note:: Points are kept contiguous as (x, y, z) triplets, the layout OpenCV expects for object points,
+            so they are passed to calibrateCamera and solvePnP without conversion.
+    """
+    xs = np.arange(dim_x, dtype=np.float32) - (dim_x // 2)
+    ys = np.arange(dim_y - 1, -1, -1, dtype=np.float32) - (dim_y // 2)
+    grid_x, grid_y = np.meshgrid(xs, ys)
+    checkerboard_ref_points = np.stack(
+        [grid_x.ravel(), grid_y.ravel(), np.zeros(grid_x.size, np.float32)],
+        axis=1
+    )
+    # Cached and shared between calls, make sure nobody modifies it in place
+    checkerboard_ref_points.setflags(write=False)
+    return checkerboard_ref_points
+
+
+class ChessboardCornersDetector(QtCore.QThread):
+    """Find chessboard corners in a separate thread, always working on the latest submitted image."""
+
+    # Signal whenever a detection is done.
+    # The first argument is the grayscale image, the second, the checkerboard dimension,
+    # the third, the corners or None if the checkerboard was not found
+    # and the fourth, whether or not the corners are already sub-pixel accurate.
+    corners_detected = QtCore.pyqtSignal(np.ndarray, tuple, object, bool)
 
     def __init__(self):
         """Initialize."""
         super().__init__()
 
+        self._pending_deque = collections.deque(maxlen=1)
+        self._condition = threading.Condition()
+        self._is_running = False
+        self._is_processing = False
+
+    def is_idle(self):
+        """Whether or not the detector is waiting for a new image.
+
+        :return: True if no image is waiting or being processed.
+        :rtype: bool
+        """
+        with self._condition:
+            return not self._pending_deque and not self._is_processing
+
+    def submit(self, frame_gray, checkerboard_dim):
+        """Submit an image for detection, replacing the one waiting to be processed if any.
+
+        :param frame_gray: The grayscale image.
+        :type frame_gray: :class:`numpy.ndarray`
+
+        :param checkerboard_dim: The number of inner corners as (width, height).
+        :type checkerboard_dim: tuple[int, int]
+        """
+        with self._condition:
+            self._pending_deque.append((frame_gray, checkerboard_dim))
+            self._condition.notify()
+
+    def stop(self):
+        """Stop the thread from running.
+
+        When calling this method, you should also call wait() to make sure it stopped.
+        """
+        with self._condition:
+            self._is_running = False
+            self._pending_deque.clear()
+            self._condition.notify()
+
+    @staticmethod
+    def screen(frame_gray, checkerboard_dim):
+        """Quickly check if a chessboard could be in the image using a downscaled copy.
+
+        :param frame_gray: The grayscale image.
+        :type frame_gray: :class:`numpy.ndarray`
+
+        :param checkerboard_dim: The number of inner corners as (width, height).
+        :type checkerboard_dim: tuple[int, int]
+
+        :return: Whether or not the full resolution detection is worth running.
+        :rtype: bool
+        """
+        small_gray = cv.resize(
+            frame_gray,
+            None,
+            fx=constants.CHESSBOARD_SCREENING_SCALE,
+            fy=constants.CHESSBOARD_SCREENING_SCALE,
+            interpolation=cv.INTER_AREA
+        )
+        ret, _ = cv.findChessboardCorners(small_gray, checkerboard_dim, flags=cv.CALIB_CB_FAST_CHECK)
+        return bool(ret)
+
+    def run(self):
+        """Find the chessboard corners of submitted images and emit corners_detected signal with the result."""
+        self._is_running = True
+        while True:
+            with self._condition:
+                while self._is_running and not self._pending_deque:
+                    self._condition.wait()
+                if not self._is_running:
+                    break
+                frame_gray, checkerboard_dim = self._pending_deque.popleft()
+                self._is_processing = True
+
+            corners = None
+            is_subpixel = False
+            if self.screen(frame_gray, checkerboard_dim):
+                # The sector based detector returns sub-pixel accurate corners, fallback on the classic one if it fails
+                ret, corners = cv.findChessboardCornersSB(frame_gray, checkerboard_dim, flags=constants.CHESSBOARD_SB_FLAGS)
+                is_subpixel = bool(ret)
+                if not ret:
+                    ret, corners = cv.findChessboardCorners(frame_gray, checkerboard_dim)
+                    if ret:
+                        # Refine here rather than on the GUI thread when calibrating
+                        corners = cv.cornerSubPix(frame_gray, corners, (11, 11), (-1, -1), constants.CRITERIA)
+                        is_subpixel = True
+                if not ret:
+                    corners = None
+            self.corners_detected.emit(frame_gray, checkerboard_dim, corners, is_subpixel)
+            with self._condition:
+                self._is_processing = False
+
+
+class CameraCalibrationHelper(QtCore.QObject):
+    """Helper class for camera calibration."""
+
+    # Signal whenever an asynchronous calibration is done.
+    # The first argument is whether or not the calibration succeeded
+    # and the second, the root mean square reprojection error.
+    calibration_finished = QtCore.pyqtSignal(bool, float)
+
+    # Signal bringing a calibration computed in the background back to this object's thread.
+    # The arguments are the camera, its matrix and distortion coefficients, or None if the calibration failed,
+    # the image resolution and the root mean square reprojection error.
+    _calibration_computed = QtCore.pyqtSignal(object, object, object, tuple, float)
+
+    def __init__(self, camera_manager):
+        """Initialize.
+
+        :param camera_manager: The camera manager, asynchronous calibrations are only set on cameras it still manages.
+        :type camera_manager: :class:`CameraManager`
+        """
+        super().__init__()
+        self._camera_manager = camera_manager
+
         self._calibration_packages_dict = {
             'top': None,
             'front': None,
@@ -37,6 +192,17 @@ class CameraCalibrationHelper(QtCore.QObject):
         }
 
         self._last_valid_calibration_pkg = None
+        self._detected_corners = (None, None)
+        # Latest frame submitted for detection, the same frame is never submitted twice
+        self._last_submitted_frame = None
+
+        self._corners_detector = ChessboardCornersDetector()
+        self._corners_detector.corners_detected.connect(self.set_detected_corners)
+
+        # Calibrations are computed one at a time, away from the GUI thread
+        self._calibration_executor = ThreadPoolExecutor(max_workers=1)
+        self._is_calibrating = False
+        self._calibration_computed.connect(self._set_camera_calibration)
 
     def get_view_names(self):
         """Get all the view names.
@@ -52,8 +218,9 @@ class CameraCalibrationHelper(QtCore.QObject):
         :param view_name: The name of the view in ['top', 'front', 'side'].
         :type view_name: str
 
-        :param package: Package to set on the view as a tuple of image and corners, or None to set latest valid calibration package.
-        :type package: tuple[:class:`numpy.ndarray`, :class:`MatLike`]
+        :param package: Package to set on the view as a tuple of image, corners and whether or not corners are sub-pixel accurate,
+            or None to set latest valid calibration package.
+        :type package: tuple[:class:`numpy.ndarray`, :class:`MatLike`, bool]
 
         :param force: Will set package even if None. (False)
         :type force: bool
@@ -70,9 +237,11 @@ class CameraCalibrationHelper(QtCore.QObject):
             self._calibration_packages_dict[view_name] = self._last_valid_calibration_pkg
             self._last_valid_calibration_pkg = None
 
+        self._detected_corners = (None, None)
+
         return is_valid
 
-    def get_package_image(self, view_name, as_qimage=True, qimage_format=QtGui.QImage.Format.Format_BGR888):
+    def get_package_image(self, view_name, as_qimage=True, qimage_format=QtGui.QImage.Format.Format_Grayscale8):
         """Get the image contain in a view package.
 
         :param view_name: The name of the view in ['top', 'front', 'side'].
@@ -81,25 +250,51 @@ class CameraCalibrationHelper(QtCore.QObject):
         :param as_qimage: If set to True, will return an QImage instead of the ndarray frame. (True)
         :type as_qimage: bool
 
-        :param qimage_format: The returned qimage format. (QtGui.QImage.Format.Format_BGR888)
+        :param qimage_format: The returned qimage format, Format_Grayscale8 wraps the package image without conversion.
+            (QtGui.QImage.Format.Format_Grayscale8)
         :type qimage_format: :class:`Format`
 
         :return: The grayscale image used for calibration.
         :rtype: :class:`numpy.ndarray`
         """
-        frame_gray, _ = self._calibration_packages_dict[view_name]
+        frame_gray, _, _ = self._calibration_packages_dict[view_name]
         if as_qimage:
+            if qimage_format == QtGui.QImage.Format.Format_Grayscale8:
+                return common.get_qimage_from_frame(frame_gray, qimage_format=qimage_format)
             frame = cv.cvtColor(frame_gray, cv.COLOR_GRAY2BGR)
-            return QtGui.QImage(
-                frame,
-                frame.shape[1],
-                frame.shape[0],
-                frame.strides[0],
-                qimage_format
-            )
+            # Copy so the image owns its data, the converted frame is not referenced anywhere else
+            return common.get_qimage_from_frame(frame, qimage_format=qimage_format).copy()
         else:
             return frame_gray
 
+    def get_package_thumbnail(self, view_name, max_width, max_height):
+        """Get a small version of the image contained in a view package, keeping its aspect ratio.
+
+            The downscale is done by OpenCV on the grayscale frame, which is multithreaded and releases the GIL,
+            instead of scaling a full resolution QImage on the GUI thread.
+
+        :param view_name: The name of the view in ['top', 'front', 'side'].
+        :type view_name: str
+
+        :param max_width: The maximum width in pixels.
+        :type max_width: int
+
+        :param max_height: The maximum height in pixels.
+        :type max_height: int
+
+        :return: The thumbnail image.
+        :rtype: :class:`QImage`
+        """
+        frame_gray, _, _ = self._calibration_packages_dict[view_name]
+        height, width = frame_gray.shape[:2]
+        scale = min(max_width / width, max_height / height)
+        thumbnail = cv.resize(
+            frame_gray,
+            (max(1, int(width * scale)), max(1, int(height * scale))),
+            interpolation=cv.INTER_AREA
+        )
+        return common.get_qimage_from_frame(thumbnail, qimage_format=QtGui.QImage.Format.Format_Grayscale8)
+
     def get_checkerboard_3d_reference_points(self, number_of_squares_w, number_of_squares_h):
         """Get checkboard 3D reference points.
 
@@ -111,23 +306,31 @@ class CameraCalibrationHelper(QtCore.QObject):
 
         :return: Array of reference points.
         :rtype: :class:`np.ndarray`
+
+        .. note:: The returned array is cached, shared between calls and read-only.
         """
-        dim_x = number_of_squares_w - 1
-        dim_x_2 = int(dim_x / 2)
-        dim_y = number_of_squares_h - 1
-        dim_y_2 = int(dim_y / 2)
+        return _build_checkerboard_3d_reference_points(number_of_squares_w - 1, number_of_squares_h - 1)
 
-        checkerboard_ref_points = []
+    @staticmethod
+    def _get_subpixel_corners(calibration_package):
+        """Get the sub-pixel accurate corners of a calibration package, refining them if needed.
 
-        for y in range(dim_y - 1, -1, -1):
-            for x in range(dim_x):
-                checkerboard_ref_points.append([
-                    (x - dim_x_2),
-                    (y - dim_y_2),
-                    0.0
-                ])
+        :param calibration_package: The grayscale image, corners and whether or not the corners are already sub-pixel accurate.
+        :type calibration_package: tuple[:class:`numpy.ndarray`, :class:`numpy.ndarray`, bool]
 
-        return np.array(checkerboard_ref_points, np.float32)
+        :return: The corners.
+        :rtype: :class:`numpy.ndarray`
+        """
+        frame_gray, corners, is_subpixel = calibration_package
+        if is_subpixel:
+            return corners
+        return cv.cornerSubPix(
+            frame_gray,
+            corners,
+            (11, 11),
+            (-1, -1),
+            constants.CRITERIA
+        )
 
     def calibrate(self, camera, number_of_squares_w, number_of_squares_h):
         """Calibrate the camera using a checkerboard.
@@ -141,34 +344,138 @@ class CameraCalibrationHelper(QtCore.QObject):
         :param number_of_squares_h: The number of squares on the checkerboard's height direction.
         :type number_of_squares_h: int
 
-        :return: The mean error of the calibration.
+        :return: The root mean square reprojection error of the calibration.
         :rtype: float
         """
+        return camera.calibrate(
+            *self._get_calibration_points(
+                list(self._calibration_packages_dict.values()),
+                number_of_squares_w,
+                number_of_squares_h
+            )
+        )
+
+    def calibrate_async(self, camera, number_of_squares_w, number_of_squares_h):
+        """Calibrate the camera using a checkerboard in a background thread.
+
+            The calibration is set on the camera from this object's thread once computed,
+            then the calibration_finished signal is emitted.
+
+        :param camera: The camera to calibrate.
+        :type camera: :class:`Camera`
+
+        :param number_of_squares_w: The number of squares on the checkerboard's width direction.
+        :type number_of_squares_w: int
+
+        :param number_of_squares_h: The number of squares on the checkerboard's height direction.
+        :type number_of_squares_h: int
+        """
+        self._is_calibrating = True
+        self._calibration_executor.submit(
+            self._compute_camera_calibration,
+            camera,
+            list(self._calibration_packages_dict.values()),
+            number_of_squares_w,
+            number_of_squares_h
+        )
+
+    def is_calibrating(self):
+        """Get whether or not an asynchronous calibration is running.
+
+        :return: True if a calibration is running.
+        :rtype: bool
+        """
+        return self._is_calibrating
+
+    def _get_calibration_points(self, calibration_packages_list, number_of_squares_w, number_of_squares_h):
+        """Get the 3d and sub-pixel accurate 2d points of the calibration packages.
+
+        :param calibration_packages_list: The calibration packages, one for each view.
+        :type calibration_packages_list: list[tuple]
+
+        :param number_of_squares_w: The number of squares on the checkerboard's width direction.
+        :type number_of_squares_w: int
+
+        :param number_of_squares_h: The number of squares on the checkerboard's height direction.
+        :type number_of_squares_h: int
+
+        :return: The 3d points list, 2d points list and image resolution as (width, height).
+        :rtype: tuple[list, list, tuple]
+        """
         checkerboard_3d_reference_points_array = self.get_checkerboard_3d_reference_points(
             number_of_squares_w,
             number_of_squares_h
         )
-        checkerboard_3d_points_list = []
-        checkerboard_2d_points_list = []
-        image_resolution = None
-        for frame_gray, corners in self._calibration_packages_dict.values():
-            image_resolution = frame_gray.shape[::-1]
-            corners2 = cv.cornerSubPix(
-                frame_gray,
-                corners,
-                (11, 11),
-                (-1, -1),
-                constants.CRITERIA
+        image_resolution = calibration_packages_list[-1][0].shape[::-1]
+        # Views are refined in parallel, cornerSubPix releases the GIL
+        with ThreadPoolExecutor(max_workers=len(calibration_packages_list)) as executor:
+            checkerboard_2d_points_list = list(executor.map(self._get_subpixel_corners, calibration_packages_list))
+        checkerboard_3d_points_list = [checkerboard_3d_reference_points_array] * len(checkerboard_2d_points_list)
+
+        return checkerboard_3d_points_list, checkerboard_2d_points_list, image_resolution
+
+    def _compute_camera_calibration(self, camera, calibration_packages_list, number_of_squares_w, number_of_squares_h):
+        """Compute a camera calibration and send it back to this object's thread.
+
+        .. note:: This is called from the calibration thread.
+
+        :param camera: The camera to calibrate.
+        :type camera: :class:`Camera`
+
+        :param calibration_packages_list: The calibration packages, one for each view.
+        :type calibration_packages_list: list[tuple]
+
+        :param number_of_squares_w: The number of squares on the checkerboard's width direction.
+        :type number_of_squares_w: int
+
+        :param number_of_squares_h: The number of squares on the checkerboard's height direction.
+        :type number_of_squares_h: int
+        """
+        try:
+            checkerboard_3d_points_list, checkerboard_2d_points_list, image_resolution = self._get_calibration_points(
+                calibration_packages_list,
+                number_of_squares_w,
+                number_of_squares_h
             )
+            mtx, dist, rms_error = camera.compute_calibration(
+                checkerboard_3d_points_list,
+                checkerboard_2d_points_list,
+                image_resolution
+            )
+        except Exception:
+            traceback.print_exc()
+            self._calibration_computed.emit(camera, None, None, (), 0.0)
+            return
 
-            checkerboard_3d_points_list.append(checkerboard_3d_reference_points_array)
-            checkerboard_2d_points_list.append(corners2)
+        self._calibration_computed.emit(camera, mtx, dist, image_resolution, rms_error)
 
-        return camera.calibrate(
-            checkerboard_3d_points_list,
-            checkerboard_2d_points_list,
-            image_resolution
-        )
+    @QtCore.pyqtSlot(object, object, object, tuple, float)
+    def _set_camera_calibration(self, camera, mtx, dist, image_resolution, rms_error):
+        """Set a calibration computed in the background on its camera.
+
+        :param camera: The calibrated camera.
+        :type camera: :class:`Camera`
+
+        :param mtx: The camera matrix or None if the calibration failed.
+        :type mtx: :class:`numpy.ndarray`
+
+        :param dist: The distortion coefficients or None if the calibration failed.
+        :type dist: :class:`numpy.ndarray`
+
+        :param image_resolution: The image resolution as (width, height).
+        :type image_resolution: tuple[int, int]
+
+        :param rms_error: The root mean square reprojection error.
+        :type rms_error: float
+        """
+        self._is_calibrating = False
+        # The camera was deleted and released while calibrating
+        if mtx is None or not self._camera_manager.is_managed(camera):
+            self.calibration_finished.emit(False, rms_error)
+            return
+
+        camera.set_calibration(mtx, dist, image_resolution)
+        self.calibration_finished.emit(True, rms_error)
 
     def uncalibrate(self, camera):
         """Uncalibrate a camera.
@@ -180,11 +487,33 @@ class CameraCalibrationHelper(QtCore.QObject):
         for view_name in self._calibration_packages_dict.keys():
             self._calibration_packages_dict[view_name] = None
 
+    @QtCore.pyqtSlot(np.ndarray, tuple, object, bool)
+    def set_detected_corners(self, frame_gray, checkerboard_dim, corners, is_subpixel):
+        """Latest chessboard corners detection received from the detector thread.
+
+        :param frame_gray: The grayscale image the detection was done on.
+        :type frame_gray: :class:`numpy.ndarray`
+
+        :param checkerboard_dim: The number of inner corners as (width, height).
+        :type checkerboard_dim: tuple[int, int]
+
+        :param corners: The corners or None if the checkerboard was not found.
+        :type corners: :class:`MatLike`
+
+        :param is_subpixel: Whether or not the corners are already sub-pixel accurate.
+        :type is_subpixel: bool
+        """
+        self._detected_corners = (checkerboard_dim, corners)
+        if corners is not None:
+            self._last_valid_calibration_pkg = frame_gray, corners, is_subpixel
+
     def find_chessboard_corners(self, camera_frame, number_of_squares_w, number_of_squares_h, draw_corners=True):
-        """Find the chessboard corners in the image and store package internally if valid.
+        """Submit the image for chessboard corners detection and draw the latest corners found.
 
-        :param camera: The camera to calibrate.
-        :type camera: :class:`Camera`
+        The detection itself is done in a separate thread, the package is stored internally once valid corners are found.
+
+        :param camera_frame: The camera frame in BGR888 format.
+        :type camera_frame: :class:`numpy.ndarray`
 
         :param number_of_squares_w: The number of squares on the checkerboard's width direction.
         :type number_of_squares_w: int
@@ -195,27 +524,38 @@ class CameraCalibrationHelper(QtCore.QObject):
         :param draw_corners: Whether to draw the corners or not on the returned image. (True)
         :type draw_corners: bool
 
-        :return: The image.
+        :return: The image, a copy of the frame if corners were drawn.
         :rtype: :class:`numpy.ndarray`
+
+            .. note:: The camera frame is shared with the camera and other consumers, it's never modified.
         """
-        gray = cv.cvtColor(camera_frame, cv.COLOR_BGR2GRAY)
+        if not self._corners_detector.isRunning():
+            self._corners_detector.start()
 
         checkerboard_dim = (
             number_of_squares_w - 1,
             number_of_squares_h - 1
         )
-        ret, corners = cv.findChessboardCorners(gray, checkerboard_dim, flags=cv.CALIB_CB_FAST_CHECK)
-        if ret:
-            self._last_valid_calibration_pkg = gray, corners
-            if draw_corners:
-                camera_frame = cv.drawChessboardCorners(
-                    cv.cvtColor(gray, cv.COLOR_GRAY2BGR),
-                    checkerboard_dim,
-                    corners,
-                    ret
-                )
+
+        # Only convert to grayscale when the detector can take it, any other image would be replaced before being processed
+        if camera_frame is not self._last_submitted_frame and self._corners_detector.is_idle():
+            self._corners_detector.submit(cv.cvtColor(camera_frame, cv.COLOR_BGR2GRAY), checkerboard_dim)
+            self._last_submitted_frame = camera_frame
+
+        detected_checkerboard_dim, corners = self._detected_corners
+        if draw_corners and corners is not None and detected_checkerboard_dim == checkerboard_dim:
+            # Draw on a display copy, the frame itself must stay clean for detection and calibration packages
+            camera_frame = camera_frame.copy()
+            cv.drawChessboardCorners(camera_frame, checkerboard_dim, corners, True)
         return camera_frame
 
+    def stop(self):
+        """Stop the chessboard corners detector thread and wait for any running calibration."""
+        self._corners_detector.stop()
+        self._calibration_executor.shutdown(cancel_futures=True)
+        self._corners_detector.wait()
+        self._last_submitted_frame = None
+
     def has_all_calibration_images(self):
         """Get whether or not all calibration images are there.
 
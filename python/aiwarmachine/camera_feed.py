@@ -152,6 +152,9 @@ class CameraFeed(QtCore.QThread):
                 self.frame_grabbed.emit(frame, False)
                 return
 
+            # Avoid reading stale frames queued by the backend
+            self._capture.set(cv.CAP_PROP_BUFFERSIZE, constants.DEFAULT_CAPTURE_BUFFER_SIZE)
+
         self._send_signal = True
         self._is_running = True
         while self._capture is not None and self._capture.isOpened() and self._is_running:
@@ -165,16 +168,17 @@ class CameraFeed(QtCore.QThread):
 
             if not cap_ret:
                 # Problem while reading, put red frame in BGR888 format
+                # Filled on creation instead of zeroed then painted, a single pass over the frame
                 width, height = self._get_capture_resolution()
-                frame = np.zeros(
+                frame = np.full(
                     (
                         height,
                         width,
                         3
                     ),
+                    (0, 0, 255),
                     dtype=np.uint8
                 )
-                frame[:, :] = (0, 0, 255)
 
             if self._send_signal:
                 self.frame_grabbed.emit(frame, cap_ret)
@@ -16,6 +16,8 @@
 #
 """Camera manager modules for camera related operations."""
 
+from concurrent.futures import ThreadPoolExecutor
+
 from PyQt6 import QtCore
 import cv2 as cv
 
@@ -31,6 +33,18 @@ class CameraManager(QtCore.QObject):
 
         self._cameras_dict = {}
         self._current_camera_id = -1
+        # The camera matching the current id, kept up to date so getting the current camera needs no lookup
+        self._current_camera = None
+        # Device ids not taken yet, kept up to date when cameras are added, deleted or change device id
+        self._available_device_ids_set = set(constants.DEFAULT_DEVICE_IDS_LIST)
+        self._available_device_ids_list = []
+        self._available_device_ids_str_list = []
+        self._update_available_device_ids_lists()
+
+    def _update_available_device_ids_lists(self):
+        """Rebuild the sorted available device ids lists, as int and str, after the available set changed."""
+        self._available_device_ids_list = sorted(self._available_device_ids_set)
+        self._available_device_ids_str_list = [str(_i) for _i in self._available_device_ids_list]
 
     def get_available_device_ids_list(self, as_list_of_str=False):
         """Get the available device ids list.
@@ -40,11 +54,23 @@ class CameraManager(QtCore.QObject):
 
         :return: Device ids not taken yet.
         :rtype: list of int
+
+        .. note:: The returned list is shared between calls until the available device ids change, do not modify it.
         """
-        cast_class = int
         if as_list_of_str:
-            cast_class = str
-        return [cast_class(_i) for _i in constants.DEFAULT_DEVICE_IDS_LIST if _i not in self._cameras_dict]
+            return self._available_device_ids_str_list
+        return self._available_device_ids_list
+
+    def is_device_id_available(self, device_id):
+        """Check if a device id is not taken yet.
+
+        :param device_id: The capture device ID.
+        :type device_id: int
+
+        :return: Whether or not this device id is available.
+        :rtype: bool
+        """
+        return device_id in self._available_device_ids_set
 
     def add_camera(self, **kwargs):
         """Add a new camera to the list, see camera.Camera for all available kwargs.
@@ -55,7 +81,10 @@ class CameraManager(QtCore.QObject):
         device_id = kwargs.get('device_id', 0)
         new_camera_obj = camera.Camera(**kwargs)
         self._cameras_dict[device_id] = new_camera_obj
+        self._available_device_ids_set.discard(device_id)
+        self._update_available_device_ids_lists()
         self._current_camera_id = device_id
+        self._current_camera = new_camera_obj
         return new_camera_obj
 
     def get_camera(self, device_id=None):
@@ -68,9 +97,20 @@ class CameraManager(QtCore.QObject):
         :rtype: :class:`Camera`
         """
         if device_id is None:
-            device_id = self._current_camera_id
+            return self._current_camera
         return self._cameras_dict.get(device_id)
 
+    def is_managed(self, camera_obj):
+        """Get whether or not a camera is still one of the managed cameras.
+
+        :param camera_obj: The camera.
+        :type camera_obj: :class:`Camera`
+
+        :return: True if the camera was not deleted.
+        :rtype: bool
+        """
+        return any(_camera_obj is camera_obj for _camera_obj in self._cameras_dict.values())
+
     def set_current_camera(self, device_id):
         """Set the camera with specific device id as current.
 
@@ -84,6 +124,7 @@ class CameraManager(QtCore.QObject):
             if not camera_obj.is_running():
                 camera_obj.start()
             self._current_camera_id = device_id
+            self._current_camera = camera_obj
             return True
         else:
             return False
@@ -100,7 +141,11 @@ class CameraManager(QtCore.QObject):
         if (camera_obj := self.get_camera(device_id)) is not None:
             camera_obj.release()
             self._current_camera_id = -1
+            self._current_camera = None
             del self._cameras_dict[device_id]
+            if device_id in constants.DEFAULT_DEVICE_IDS_LIST:
+                self._available_device_ids_set.add(device_id)
+                self._update_available_device_ids_lists()
             return True
         else:
             return False
@@ -108,6 +153,9 @@ class CameraManager(QtCore.QObject):
     def set_current_camera_capture_resolution(self, width, height):
         """Set the capture resolution of the current camera.
 
+            A running camera feed applies the new resolution itself from its own thread,
+            so there's no need to stop and wait for it here.
+
         :param width: The width in pixels.
         :type width: int
 
@@ -118,10 +166,9 @@ class CameraManager(QtCore.QObject):
         :rtype: bool
         """
         if (current_camera := self.get_camera()) is not None:
-            current_camera.stop()
-            current_camera.set_capture_property(cv.CAP_PROP_FRAME_WIDTH, width)
-            current_camera.set_capture_property(cv.CAP_PROP_FRAME_HEIGHT, height)
-            current_camera.start()
+            current_camera.set_capture_properties({cv.CAP_PROP_FRAME_WIDTH: width, cv.CAP_PROP_FRAME_HEIGHT: height})
+            if not current_camera.is_running():
+                current_camera.start()
             return True
         else:
             return False
@@ -203,15 +250,24 @@ class CameraManager(QtCore.QObject):
         :rtype: bool
         """
         if (current_camera := self.get_camera()) is not None:
-            if device_id != current_camera.device_id and device_id in self.get_available_device_ids_list():
+            if device_id != current_camera.device_id and device_id in self._available_device_ids_set:
                 self._cameras_dict[device_id] = self._cameras_dict[current_camera.device_id]
                 del self._cameras_dict[current_camera.device_id]
+                self._available_device_ids_set.discard(device_id)
+                if current_camera.device_id in constants.DEFAULT_DEVICE_IDS_LIST:
+                    self._available_device_ids_set.add(current_camera.device_id)
+                self._update_available_device_ids_lists()
                 current_camera.device_id = device_id
                 self._current_camera_id = device_id
                 return True
         return False
 
     def release_all(self):
-        """Release all active cameras."""
-        for _, camera_obj in self._cameras_dict.items():
-            camera_obj.release()
+        """Release all active cameras.
+
+            Cameras are released in parallel since releasing a capture device can take a while.
+        """
+        if not self._cameras_dict:
+            return
+        with ThreadPoolExecutor(max_workers=len(self._cameras_dict)) as executor:
+            list(executor.map(lambda _camera_obj: _camera_obj.release(), self._cameras_dict.values()))
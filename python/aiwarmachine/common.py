@@ -17,9 +17,8 @@
 """common functions."""
 
 import os
-import json
 
-from PyQt6 import QtWidgets, QtGui
+from PyQt6 import QtWidgets, QtGui, sip
 import cv2 as cv
 import numpy as np
 
@@ -107,6 +106,29 @@ def get_frame_with_text(
     return cv.putText(frame, text, position, font, fontsize, color=color, thickness=2, lineType=cv.LINE_AA)
 
 
+def get_qimage_from_frame(frame, qimage_format=QtGui.QImage.Format.Format_BGR888):
+    """Wrap a frame in a QImage without copying its data.
+
+        .. note:: The returned image keeps a reference to the frame, but copies made by Qt don't,
+            keep the frame referenced for as long as any image sharing its data is used.
+
+    :param frame: The frame, rows don't need to be contiguous but pixels within a row do.
+    :type frame: :class:`numpy.ndarray`
+
+    :param qimage_format: The image format matching the frame layout. (QtGui.QImage.Format.Format_BGR888)
+    :type qimage_format: :class:`Format`
+
+    :return: The image.
+    :rtype: :class:`QImage`
+    """
+    height, width = frame.shape[:2]
+    # Pass the raw buffer address so the binding can't fall back to a copy through the buffer protocol
+    image = QtGui.QImage(sip.voidptr(frame.ctypes.data), width, height, frame.strides[0], qimage_format)
+    # Qt doesn't own the buffer, tie the frame lifetime to the image wrapper
+    image._frame = frame
+    return image
+
+
 def message_box(
     title,
     text,
@@ -203,10 +225,7 @@ def get_capture_property_id(property_name):
     :return: The property id.
     :rtype: int
     """
-    return find_key_for_value_in_dict(
-        property_name,
-        constants.CAPTURE_PROPERTIES_NAMES_DICT
-    )
+    return constants.CAPTURE_PROPERTIES_IDS_DICT.get(property_name)
 
 
 def get_aiwarmachine_root_dir():
@@ -228,8 +247,7 @@ def get_saved_subdir(subdir_name):
     :rtype: str
     """
     subdir_path = f"{get_aiwarmachine_root_dir()}/saved/{subdir_name}"
-    if not os.path.exists(subdir_path):
-        os.makedirs(subdir_path)
+    os.makedirs(subdir_path, exist_ok=True)
     return subdir_path
 
 
@@ -299,6 +317,7 @@ def composite_images(
     overlay_y=0,
     image_format=QtGui.QImage.Format.Format_ARGB32_Premultiplied,
     composite_mode=QtGui.QPainter.CompositionMode.CompositionMode_SourceOver,
+    image_result=None,
 ):
     """Composite 2 images using specific mode.
 
@@ -320,23 +339,109 @@ def composite_images(
     :param composite_mode: The composite mode. (QtGui.QPainter.CompositionMode.CompositionMode_SourceOver)
     :type composite_mode: :class:`CompositionMode`
 
+    :param image_result: Image to reuse for the result if it has the right size and format, can be the base image itself. (None)
+    :type image_result: :class:`QImage`
+
+    :return: Composite image.
+    :rtype: :class:`QImage`
+    """
+    return composite_overlays(
+        image_base,
+        [(image_overlay, overlay_x, overlay_y, composite_mode)],
+        image_format=image_format,
+        image_result=image_result
+    )
+
+
+def composite_overlays(
+    image_base,
+    overlays_list,
+    image_format=QtGui.QImage.Format.Format_ARGB32_Premultiplied,
+    image_result=None,
+):
+    """Composite multiple overlays over a base image in a single painter pass.
+
+    :param image_base: The base image.
+    :type image_base: :class:`QImage`
+
+    :param overlays_list: The overlays to composite in order, as (image, overlay_x, overlay_y, composite_mode).
+    :type overlays_list: list[tuple[:class:`QImage`, int, int, :class:`CompositionMode`]]
+
+    :param image_format: The returned image format. (QtGui.QImage.Format.Format_ARGB32_Premultiplied)
+    :type image_format: :class:`Format`
+
+    :param image_result: Image to reuse for the result if it has the right size and format, can be the base image itself. (None)
+    :type image_result: :class:`QImage`
+
     :return: Composite image.
     :rtype: :class:`QImage`
     """
-    image_result = QtGui.QImage(image_base.size(), image_format)
+    if image_result is None or image_result.size() != image_base.size() or image_result.format() != image_format:
+        image_result = QtGui.QImage(image_base.size(), image_format)
     painter = QtGui.QPainter(image_result)
 
-    painter.setCompositionMode(QtGui.QPainter.CompositionMode.CompositionMode_Source)
-    painter.drawImage(0, 0, image_base)
+    if image_result is not image_base:
+        painter.setCompositionMode(QtGui.QPainter.CompositionMode.CompositionMode_Source)
+        painter.drawImage(0, 0, image_base)
 
-    painter.setCompositionMode(composite_mode)
-    painter.drawImage(overlay_x, overlay_y, image_overlay)
+    for image_overlay, overlay_x, overlay_y, composite_mode in overlays_list:
+        painter.setCompositionMode(composite_mode)
+        painter.drawImage(overlay_x, overlay_y, image_overlay)
 
     painter.end()
 
     return image_result
 
 
+def get_frame_from_qimage(image):
+    """Wrap the data of a QImage in a numpy array without copying it.
+
+        .. note:: The image must be kept referenced and unmodified for as long as the frame is used.
+
+    :param image: The image, its format must use a whole number of bytes per pixel.
+    :type image: :class:`QImage`
+
+    :return: The frame, rows are not contiguous if the image has padding at the end of its lines.
+    :rtype: :class:`numpy.ndarray`
+    """
+    width = image.width()
+    height = image.height()
+    channels = image.depth() // 8
+
+    ptr = image.constBits()
+    ptr.setsize(image.sizeInBytes())
+    frame = np.frombuffer(ptr, np.uint8).reshape(height, image.bytesPerLine())[:, :width * channels]
+    if channels == 1:
+        return frame
+    return frame.reshape(height, width, channels)
+
+
+def resize_qimage_to_frame(image, width, height, frame_result=None):
+    """Resize an image with OpenCV area interpolation, which is multithreaded and smoother than a Qt fast transformation.
+
+    :param image: The image to resize.
+    :type image: :class:`QImage`
+
+    :param width: The resized width in pixels.
+    :type width: int
+
+    :param height: The resized height in pixels.
+    :type height: int
+
+    :param frame_result: Frame to reuse for the result if it has the right shape. (None)
+    :type frame_result: :class:`numpy.ndarray`
+
+    :return: The resized frame, with the same channels as the image.
+    :rtype: :class:`numpy.ndarray`
+    """
+    frame = get_frame_from_qimage(image)
+    shape = (height, width) + frame.shape[2:]
+    if frame_result is None or frame_result.shape != shape:
+        frame_result = np.empty(shape, np.uint8)
+    cv.resize(frame, (width, height), dst=frame_result, interpolation=cv.INTER_AREA)
+    return frame_result
+
+
 def convert_qimage_to_numpy_array(image):
     """Convert a QImage to a numpy array.
 
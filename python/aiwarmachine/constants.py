@@ -28,24 +28,53 @@ GITHUB_WIKI_URL = "https://github.com/madesjardins/AiWarmachine/wiki"
 
 IS_LINUX = sys.platform.startswith('linux')
 
+# Opt-in OpenCL offloading of per-frame OpenCV operations, only used if OpenCV actually has OpenCL available
+USE_OPENCL = os.getenv("AIWARMACHINE_USE_OPENCL", "0") == "1" and cv.ocl.haveOpenCL()
+# Opt-in CUDA offloading of the undistortion, only used if OpenCV was built with CUDA and a device is available
+USE_CUDA = os.getenv("AIWARMACHINE_USE_CUDA", "0") == "1" and cv.cuda.getCudaEnabledDeviceCount() > 0
+
 TEMP_DIRPATH = os.getenv("TEMP_DIRPATH")
 VOICE_NARRATOR_TEMP_OUTPUT_FILEPATH_TEMPLATE = os.path.join(TEMP_DIRPATH, "narrator.{:04d}.wav")
 PIPER_DIRPATH = os.getenv("PIPER_DIRPATH")
 PIPER_EXECUTABLE = os.path.join(PIPER_DIRPATH, "piper.exe")
 PIPER_VOICES_DIRPATH = os.path.join(PIPER_DIRPATH, "voices")
 
+# Fixed-point undistort maps, half the memory of float maps and the fast remap path, precise to 1/32 pixel
+UNDISTORT_MAP_TYPE = cv.CV_16SC2
+
 CRITERIA = (cv.TERM_CRITERIA_EPS + cv.TERM_CRITERIA_MAX_ITER, 30, 0.001)
+# LU decomposition is faster than the default SVD for the small systems of a camera calibration
+CAMERA_CALIBRATION_FLAGS = cv.CALIB_USE_LU
+CHESSBOARD_SB_FLAGS = cv.CALIB_CB_NORMALIZE_IMAGE
+# Scale of the image used to quickly reject frames without a chessboard before the full resolution detection
+CHESSBOARD_SCREENING_SCALE = 0.5
 
 DEFAULT_TICKS_PER_SECOND = 30
 DEFAULT_PROJECTOR_FRAMES_PER_SECOND = 15
 DEFAULT_QR_DETECTION_PER_SECOND = 10
 
+# Delay in ms to wait for a camera property widget to stop changing before applying its value
+CAMERA_PROPERTY_DEBOUNCE_INTERVAL = 64
+
+# Scale applied to viewport frames while the user drags a camera property slider
+FAST_PREVIEW_SCALE = 0.5
+
+# Weight of the latest measure in the exponential moving average of the frame processing time
+PROCESSING_TIME_EMA_FACTOR = 0.1
+
+# Weight of the latest frame in the exponential moving average of a camera fps
+FPS_EMA_FACTOR = 0.1
+
 DEFAULT_CAPTURE_API = cv.CAP_V4L2 if IS_LINUX else cv.CAP_DSHOW
 
 DEFAULT_CAPTURE_WIDTH = 1920
 DEFAULT_CAPTURE_HEIGHT = 1080
 DEFAULT_FPS = 30
 
+# Number of frames buffered by the capture backend, keep it low to always read the latest frame.
+DEFAULT_CAPTURE_BUFFER_SIZE = 1
+
+# Flat cv.CAP_PROP_ to scalar value mapping, capture properties dicts only ever need shallow copies
 DEFAULT_CAPTURE_PROPERTIES_DICT = {
     cv.CAP_PROP_HW_ACCELERATION: cv.VIDEO_ACCELERATION_ANY,
     cv.CAP_PROP_FRAME_WIDTH: DEFAULT_CAPTURE_WIDTH,
@@ -84,6 +113,7 @@ CAPTURE_PROPERTIES_NAMES_DICT = {
     cv.CAP_PROP_SHARPNESS: "Sharpness",
     cv.CAP_PROP_ZOOM: "Zoom",
 }
+CAPTURE_PROPERTIES_IDS_DICT = {_name: _id for _id, _name in CAPTURE_PROPERTIES_NAMES_DICT.items()}
 
 FOURCC_INT_TO_STR = {
     1196444237: 'MJPG',
@@ -154,6 +184,9 @@ TABLE_CORNERS_DRAWING_ORDER = [TABLE_CORNERS_INDEX_BL, TABLE_CORNERS_INDEX_TL, T
 
 QR_CENTER_EPISLON = 4
 
+DEBUG_TEST_POSITION_COLOR = (255, 255, 255)
+QR_DETECTION_OVERLAY_COLOR = (255, 255, 255)
+
 TABLE_CORNERS_TYPE_CAMERA = 0
 TABLE_CORNERS_TYPE_PROJECTOR = 1
 TABLE_CORNERS_TYPE_NAME_TO_INDEX = {
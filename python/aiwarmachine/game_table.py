@@ -18,7 +18,6 @@
 
 import re
 import json
-import copy
 import math
 
 import cv2 as cv
@@ -76,6 +75,19 @@ class GameTable(QtCore.QObject):
         self._adjusted_roi = [None, None]
         self._corners_overlay_needs_update = [True, True]
         self._corners_overlay = [None, None]
+        # Drawing options the current corners overlays were drawn with, as (bold, is_calibrated)
+        self._corners_overlay_key = [None, None]
+        # Reused drawing canvas for game overlays, only reallocated when the table image size changes
+        self._game_canvas = None
+        # Pens reused for every corners overlay redraw, borders pens are indexed by bold
+        self._corners_border_pens = [
+            QtGui.QPen(QtCore.Qt.GlobalColor.white, 1, QtCore.Qt.PenStyle.SolidLine),
+            QtGui.QPen(QtCore.Qt.GlobalColor.white, 5, QtCore.Qt.PenStyle.SolidLine)
+        ]
+        self._corners_ellipse_pens_dict = {
+            _corner_id: QtGui.QPen(_color, 2, QtCore.Qt.PenStyle.SolidLine)
+            for _corner_id, _color in constants.TABLE_CORNERS_INDEX_TO_COLOR.items()
+        }
 
         for corners_type in [constants.TABLE_CORNERS_TYPE_CAMERA, constants.TABLE_CORNERS_TYPE_PROJECTOR]:
             if self._corners_list[corners_type] is None:
@@ -215,7 +227,7 @@ class GameTable(QtCore.QObject):
         :type filepath: str
         """
         with open(filepath, 'w') as fid:
-            fid.write(json.dumps(self.get_data(), indent=2))
+            json.dump(self.get_data(), fid, indent=2)
 
     def load(self, filepath):
         """Load from a table file.
@@ -224,7 +236,7 @@ class GameTable(QtCore.QObject):
         :type filepath: str
         """
         with open(filepath, 'r') as fid:
-            table_data = json.loads(fid.read())
+            table_data = json.load(fid)
 
         self._name = table_data['name']
         self._width = table_data['width']
@@ -246,6 +258,8 @@ class GameTable(QtCore.QObject):
         self._adjusted_roi = [table_data['adjusted_camera_roi'], table_data['adjusted_projector_roi']]
         self._corners_overlay_needs_update = [True, True]
         self._corners_overlay = [None, None]
+        # Drawing options the current corners overlays were drawn with, as (bold, is_calibrated)
+        self._corners_overlay_key = [None, None]
 
     def get_effective_table_image_size(self):
         """Get the effective table size in pixels using the resolution factor.
@@ -257,6 +271,28 @@ class GameTable(QtCore.QObject):
         height = self.convert_mm_to_pixel(self._height, ceiled=True)
         return width, height
 
+    def get_cleared_game_canvas(self):
+        """Get a black BGR888 image of the effective table size to draw game overlays on.
+
+            The same array is returned on every call, it's meant to be warped right after drawing.
+
+        :return: The cleared canvas.
+        :rtype: :class:`numpy.ndarray`
+        """
+        width, height = self.get_effective_table_image_size()
+        if self._game_canvas is None or self._game_canvas.shape[:2] != (height, width):
+            self._game_canvas = np.zeros(
+                (
+                    height,
+                    width,
+                    3
+                ),
+                dtype=np.uint8
+            )
+        else:
+            self._game_canvas.fill(0)
+        return self._game_canvas
+
     def get_reference_corner_2d_points(self):
         """Get the 4 corners 2d reference positions.
 
@@ -335,8 +371,15 @@ class GameTable(QtCore.QObject):
         :return: Image and ROI.
         :rtype: tuple[:class:`QImage`, tuple[int, int, int, int]]
         """
-        if self._corners_overlay[corners_type] is not None and not self._corners_overlay_needs_update[corners_type]:
+        overlay_key = (bold, self.is_calibrated())
+        if (
+            self._corners_overlay[corners_type] is not None and
+            not self._corners_overlay_needs_update[corners_type] and
+            self._corners_overlay_key[corners_type] == overlay_key
+        ):
             return self._corners_overlay[corners_type], self._adjusted_roi[corners_type]
+        self._corners_overlay_needs_update[corners_type] = False
+        self._corners_overlay_key[corners_type] = overlay_key
 
         # adjust for corner circle
         self._adjusted_roi[corners_type] = [
@@ -356,31 +399,29 @@ class GameTable(QtCore.QObject):
             image_size = QtCore.QSize(overlay_width, overlay_height)
             self._corners_overlay[corners_type] = QtGui.QImage(image_size, QtGui.QImage.Format.Format_ARGB32_Premultiplied)
 
+        # Plain memory fill, cheaper than going through the painter rasterizer for the whole overlay
+        self._corners_overlay[corners_type].fill(QtCore.Qt.GlobalColor.transparent)
         painter = QtGui.QPainter(self._corners_overlay[corners_type])
         painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing, True)
         painter.setCompositionMode(QtGui.QPainter.CompositionMode.CompositionMode_Source)
-        painter.fillRect(self._corners_overlay[corners_type].rect(), QtCore.Qt.GlobalColor.transparent)
-        pen_size = 5 if bold else 1
-        brush = QtGui.QBrush()
-        painter.setBrush(brush)
-        pen = QtGui.QPen(QtCore.Qt.GlobalColor.white, pen_size, QtCore.Qt.PenStyle.SolidLine)
-        painter.setPen(pen)
-        polyline_points_list = []
-        for corner_id in constants.TABLE_CORNERS_DRAWING_ORDER:
-            polyline_points_list.append(
-                QtCore.QPoint(
-                    self._corners_list[corners_type][corner_id][constants.TABLE_CORNERS_AXIS_X] - self._adjusted_roi[corners_type][constants.ROI_MIN_X],
-                    self._corners_list[corners_type][corner_id][constants.TABLE_CORNERS_AXIS_Y] - self._adjusted_roi[corners_type][constants.ROI_MIN_Y]
-                )
+        painter.setBrush(QtCore.Qt.BrushStyle.NoBrush)
+        painter.setPen(self._corners_border_pens[int(bold)])
+        offset_x = self._adjusted_roi[corners_type][constants.ROI_MIN_X]
+        offset_y = self._adjusted_roi[corners_type][constants.ROI_MIN_Y]
+        corners_polygon = QtGui.QPolygon([
+            QtCore.QPoint(
+                self._corners_list[corners_type][corner_id][constants.TABLE_CORNERS_AXIS_X] - offset_x,
+                self._corners_list[corners_type][corner_id][constants.TABLE_CORNERS_AXIS_Y] - offset_y
             )
-        # Need the first in last to to close
-        polyline_points_list.append(polyline_points_list[0])
-        painter.drawPolyline(polyline_points_list)
+            for corner_id in constants.TABLE_CORNERS_DRAWING_ORDER
+        ])
+        # With an empty brush, the polygon is drawn as a closed polyline
+        painter.drawPolygon(corners_polygon)
         if not self.is_calibrated():
             # Draw corner ellipse when not calibrated
             for corner_id in constants.TABLE_CORNERS_DRAWING_ORDER:
-                painter.setPen(QtGui.QPen(constants.TABLE_CORNERS_INDEX_TO_COLOR[corner_id], 2, QtCore.Qt.PenStyle.SolidLine))
-                painter.drawEllipse(polyline_points_list[corner_id], 10, 10)
+                painter.setPen(self._corners_ellipse_pens_dict[corner_id])
+                painter.drawEllipse(corners_polygon.point(corner_id), 10, 10)
         painter.end()
 
         return self._corners_overlay[corners_type], self._adjusted_roi[corners_type]
@@ -455,34 +496,23 @@ class GameTable(QtCore.QObject):
         if not debug_data or not self.is_calibrated():
             return None
 
-        width, height = self.get_effective_table_image_size()
-
-        image = np.zeros(
-            (
-                height,
-                width,
-                3
-            ),
-            dtype=np.uint8
-        )
+        image = self.get_cleared_game_canvas()
 
         if test_position_data := debug_data.get('test_position'):
 
             thickness = test_position_data['thickness']
             size = test_position_data['size']
+            pos_x, pos_y = test_position_data['pos']
 
-            cv.line(
-                image,
-                (test_position_data['pos'][0] - size, test_position_data['pos'][1]),
-                (test_position_data['pos'][0] + size, test_position_data['pos'][1]),
-                (255, 255, 255),
-                thickness
-            )
-            cv.line(
+            # Both segments of the cross in a single call
+            cv.polylines(
                 image,
-                (test_position_data['pos'][0], test_position_data['pos'][1] - size),
-                (test_position_data['pos'][0], test_position_data['pos'][1] + size),
-                (255, 255, 255),
+                np.int32([
+                    [[pos_x - size, pos_y], [pos_x + size, pos_y]],
+                    [[pos_x, pos_y - size], [pos_x, pos_y + size]]
+                ]),
+                False,
+                constants.DEBUG_TEST_POSITION_COLOR,
                 thickness
             )
 
@@ -491,13 +521,7 @@ class GameTable(QtCore.QObject):
         else:
             warped_image = self.warp_game_to_camera_image(image)
 
-        return QtGui.QImage(
-            warped_image,
-            warped_image.shape[1],
-            warped_image.shape[0],
-            warped_image.strides[0],
-            QtGui.QImage.Format.Format_BGR888
-        )
+        return common.get_qimage_from_frame(warped_image)
 
     # ######################
     #
@@ -539,7 +563,7 @@ class GameTable(QtCore.QObject):
         if not self.is_calibrated() or camera_roi is None:
             return None
 
-        return copy.deepcopy(camera_roi)
+        return camera_roi.copy()
 
     def warp_camera_position_to_game(self, pos, rounded=False):
         """Warp a 2D in camera roi position to game position.
@@ -561,6 +585,31 @@ class GameTable(QtCore.QObject):
         else:
             return warp_pos
 
+    def warp_camera_positions_to_game(self, positions_list, rounded=False):
+        """Warp multiple 2D in camera roi positions to game positions at once.
+
+        :param positions_list: The (x, y) positions.
+        :type positions_list: list[tuple[float]]
+
+        :param rounded: Whether or not to round the results and return integers. (False)
+        :type rounded: bool
+
+        :return: Warped positions, in the same order, or an empty list if the table is not calibrated.
+        :rtype: list[tuple[float]]
+        """
+        # Read once, this is called from the QR detection thread while the table can get uncalibrated
+        camera_to_game_matrix = self._camera_to_game_matrix
+        if not positions_list or camera_to_game_matrix is None:
+            return []
+        warp_positions = cv.perspectiveTransform(
+            np.float32(positions_list).reshape(-1, 1, 2),
+            np.float64(camera_to_game_matrix)
+        ).reshape(-1, 2)
+        if rounded:
+            return [(round(_x), round(_y)) for _x, _y in warp_positions.tolist()]
+        else:
+            return [tuple(_pos) for _pos in warp_positions.tolist()]
+
     def warp_game_position_to_camera(self, pos, rounded=False):
         """Warp a 2D in camera roi position to game position.
 
@@ -636,7 +685,7 @@ class GameTable(QtCore.QObject):
         if not self.is_calibrated() or projector_roi is None:
             return None
 
-        return copy.deepcopy(projector_roi)
+        return projector_roi.copy()
 
     def warp_game_to_projector_image(self, image):
         """Warp an image using the game -> projector perspective transform.
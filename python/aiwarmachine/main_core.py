@@ -18,7 +18,8 @@
 
 import time
 
-from PyQt6 import QtCore, QtGui
+from PyQt6 import QtCore
+import cv2 as cv
 
 from . import constants, camera_manager, camera_calibration, common, qr_detection, game_table, voice_recognition, voice_narration
 
@@ -34,9 +35,14 @@ class MainCore(QtCore.QObject):
         self._tick_interval = 1.0 / self._tps
 
         self.latest_image = None
+        self.latest_np_image = None
+        # Raw camera frame and processing options the latest image was made from
+        self._latest_image_source = (None, None)
         self._previous_processing_time = 0
+        self._processing_time_ema = 0
         self._safe_image_grab_coefficient = 1
         self._animation_frame = 0
+        self._please_wait_images_list = None
 
         self._qrdps = constants.DEFAULT_QR_DETECTION_PER_SECOND
         self._qrd_interval = 1.0 / self._qrdps
@@ -45,7 +51,7 @@ class MainCore(QtCore.QObject):
         self._pfps_interval = 1.0 / self._pfps
 
         self.camera_manager = camera_manager.CameraManager()
-        self.camera_calibration_helper = camera_calibration.CameraCalibrationHelper()
+        self.camera_calibration_helper = camera_calibration.CameraCalibrationHelper(self.camera_manager)
         self.game_table = game_table.GameTable()
         self.qr_detector = qr_detection.QRDetector(self)
 
@@ -136,7 +142,8 @@ class MainCore(QtCore.QObject):
         in_calibration=False,
         number_of_squares_w=23,
         number_of_squares_h=18,
-        simply_latest_np_image=False
+        simply_latest_np_image=False,
+        fast_preview=False
     ):
         """Get image from current camera.
 
@@ -152,6 +159,9 @@ class MainCore(QtCore.QObject):
         :param simply_latest_np_image: If set to True, simply return the latest numpy ndarray image if camera is calibrated. (False)
         :type simply_latest_np_image: bool
 
+        :param fast_preview: If set to True and the camera is not calibrated, return a downscaled image and skip chessboard corners detection. (False)
+        :type fast_preview: bool
+
         :return: Image and info string "{width}x{height} @ {fps}fps".
         :rtype: tuple[:class:`QImage`, str]
 
@@ -177,14 +187,7 @@ class MainCore(QtCore.QObject):
 
         # No image in feed, display special message
         if camera_frame is None:
-            frame = common.get_frame_with_text("Please wait" + "." * (int(self._animation_frame / 30) % 4))
-            image = QtGui.QImage(
-                frame,
-                frame.shape[1],
-                frame.shape[0],
-                frame.strides[0],
-                QtGui.QImage.Format.Format_BGR888
-            )
+            image = self.get_please_wait_images_list()[(self._animation_frame // 30) % 4]
             self._animation_frame += 1
 
             return image, info_str
@@ -192,37 +195,72 @@ class MainCore(QtCore.QObject):
         # Valid image in feed
         else:
             self._animation_frame = 0
+            is_calibrated = current_camera.is_calibrated()
+
+            # The feed didn't grab a new frame since the last tick, processing it again would give the same image.
+            # A frame can still be processed again with other options, so the processing below must never modify
+            # the raw frame in place, it always outputs a new image and leaves the camera frame untouched
+            processing_options = (in_calibration, fast_preview, is_calibrated, number_of_squares_w, number_of_squares_h)
+            latest_raw_frame, latest_processing_options = self._latest_image_source
+            if camera_frame is latest_raw_frame and processing_options == latest_processing_options:
+                return self.latest_image, info_str
+            self._latest_image_source = (camera_frame, processing_options)
+
+            if fast_preview and not is_calibrated:
+                camera_frame = cv.resize(
+                    camera_frame,
+                    None,
+                    fx=constants.FAST_PREVIEW_SCALE,
+                    fy=constants.FAST_PREVIEW_SCALE,
+                    interpolation=cv.INTER_AREA
+                )
 
-            if in_calibration:
+            elif in_calibration:
                 camera_frame = self.camera_calibration_helper.find_chessboard_corners(
                     camera_frame,
                     number_of_squares_w=number_of_squares_w,
                     number_of_squares_h=number_of_squares_h
                 )
 
-            elif current_camera.is_calibrated():
+            elif is_calibrated:
                 camera_frame = current_camera.undistort(camera_frame)
 
+            # The QImage doesn't copy the data, keeping the frame referenced keeps its buffer alive as long as the image
+            # and the row stride allows wrapping cropped views without copying them
             self.latest_np_image = camera_frame
-            self.latest_image = QtGui.QImage(
-                self.latest_np_image,
-                self.latest_np_image.shape[1],
-                self.latest_np_image.shape[0],
-                self.latest_np_image.strides[0],
-                QtGui.QImage.Format.Format_BGR888
-            )
+            self.latest_image = common.get_qimage_from_frame(camera_frame)
 
-            self._previous_processing_time = time.time() - start_process
+            # Smooth the processing time so a single slow frame doesn't make the following ones skip
+            self._processing_time_ema += constants.PROCESSING_TIME_EMA_FACTOR * (time.time() - start_process - self._processing_time_ema)
+            self._previous_processing_time = self._processing_time_ema
 
             return self.latest_image, info_str
 
+    def get_please_wait_images_list(self):
+        """Get the "Please wait" animation images, rendering them the first time only.
+
+        :return: The 4 animation images, with 0 to 3 trailing dots.
+        :rtype: list[:class:`QImage`]
+        """
+        if self._please_wait_images_list is None:
+            self._please_wait_images_list = []
+            for dots_count in range(4):
+                frame = common.get_frame_with_text("Please wait" + "." * dots_count)
+                # Copy so the image owns its data and doesn't depend on the numpy frame lifetime
+                self._please_wait_images_list.append(common.get_qimage_from_frame(frame).copy())
+        return self._please_wait_images_list
+
     def stop_all(self):
         """Stop all timers and cameras."""
         self.refresh_ticker.stop()
         self.qr_detection_ticker.stop()
         self.projector_ticker.stop()
-        self.camera_manager.release_all()
+        # Ask every thread to stop first so they all wind down while the cameras are being released
+        self.qr_detector.stop()
         self.voice_recognizer.stop()
-        self.voice_recognizer.wait()
         self.narrator.stop()
+        self.camera_calibration_helper.stop()
+        self.camera_manager.release_all()
+        self.qr_detector.wait()
+        self.voice_recognizer.wait()
         self.narrator.wait()
@@ -19,8 +19,7 @@
 import os
 import traceback
 import re
-from functools import partial
-from datetime import datetime
+from functools import partial, lru_cache
 import time
 import webbrowser
 
@@ -31,7 +30,31 @@ from . import common, constants, viewport_label, projector_dialog, camera
 
 
 VOICE_TAB_INDEX = 2
-VOICE_RECOGNITION_DEVICE_ID_REGEX = "^(?P<device_id>[0-9]+):"
+VOICE_RECOGNITION_DEVICE_ID_REGEX = re.compile(r"^(?P<device_id>[0-9]+):")
+SNAPSHOT_NAME_INVALID_CHARS_REGEX = re.compile(r"[^a-zA-Z0-9_]")
+MAIN_WIDGET_UI_FILEPATH = os.path.join(os.path.dirname(__file__), "ui", "main_widget.ui")
+
+
+@lru_cache(maxsize=1)
+def get_main_widget_class():
+    """Get the main widget class generated from the .ui file.
+
+        The .ui file is only parsed and compiled the first time, following calls reuse the generated class.
+
+    :return: The main widget class.
+    :rtype: type
+    """
+    form_class, base_class = uic.loadUiType(MAIN_WIDGET_UI_FILEPATH)
+
+    class MainWidget(base_class, form_class):
+        """Main widget built from the .ui file."""
+
+        def __init__(self):
+            """Initialize."""
+            super().__init__()
+            self.setupUi(self)
+
+    return MainWidget
 
 
 class MainWindow(QtWidgets.QMainWindow):
@@ -52,6 +75,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
         self.core = core
         self._disable_camera_settings_change = False
+        self._is_dragging_camera_slider = False
         self._in_calibration = False
         self._previous_time = time.time()
         self._selected_corner_index = None
@@ -61,6 +85,26 @@ class MainWindow(QtWidgets.QMainWindow):
         self._debug_data = None
         self._debug_overlay = None
 
+        # Reused between ticks to composite overlays over the camera image
+        self._composite_image = None
+        # Cache key of the image currently displayed in the viewport and the height it was scaled to
+        self._viewport_image_key = None
+        # Reused buffer for the scaled viewport image and the QImage wrapping it
+        self._viewport_frame = None
+        self._viewport_image = None
+        # Height the viewport image is scaled to, updated when the scroll area gets resized
+        self._viewport_target_height = None
+
+        # Selected cameras list item, updated whenever the selection changes
+        self._current_camera_item = None
+
+        # Widgets controlling camera properties by cv.CAP_PROP_ value
+        self._camera_prop_widgets_dict = {}
+
+        # Camera property values waiting to be applied, see set_camera_prop_value
+        self._pending_camera_prop_values_dict = {}
+        self._camera_prop_timers_dict = {}
+
         self._init_ui()
         self._init_connections()
         self._init_game_table()
@@ -68,7 +112,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def _init_ui(self):
         """Initialize the UI."""
-        self.ui = uic.loadUi(os.path.join(os.path.dirname(__file__), "ui", "main_widget.ui"))
+        self.ui = get_main_widget_class()()
         self.setWindowTitle(f"AiWarmachine {constants.VERSION}")
         self.setCentralWidget(self.ui)
 
@@ -81,6 +125,8 @@ class MainWindow(QtWidgets.QMainWindow):
         # Label for viewport
         self.ui.label_viewport_image = viewport_label.ViewportLabel(self.ui.scroll_viewport_widget)
         self.ui.scroll_viewport_widget.layout().addWidget(self.ui.label_viewport_image)
+        self._viewport_target_height = self.ui.scroll_viewport.size().height() - 20
+        self.ui.scroll_viewport.installEventFilter(self)
 
         self.fill_current_camera_settings(default=True)
         self.set_enabled_for_calibrations()
@@ -135,28 +181,49 @@ class MainWindow(QtWidgets.QMainWindow):
         self.ui.edit_camera_model_name.textEdited.connect(self.set_current_camera_model_name)
         self.ui.combo_camera_device_id.currentTextChanged.connect(self.set_current_camera_device_id)
         self.ui.combo_camera_capture_resolution.currentTextChanged.connect(self.set_camera_capture_resolution)
-        self.ui.spin_camera_exposure.valueChanged.connect(partial(self.set_camera_prop_value, cv.CAP_PROP_EXPOSURE))
-        self.ui.slider_camera_focus.valueChanged.connect(partial(self.set_camera_prop_value, cv.CAP_PROP_FOCUS))
-        self.ui.push_camera_focus_reset.clicked.connect(partial(self.reset_camera_slider, self.ui.slider_camera_focus, 0))
-        self.ui.slider_camera_zoom.valueChanged.connect(partial(self.set_camera_prop_value, cv.CAP_PROP_ZOOM))
-        self.ui.push_camera_zoom_reset.clicked.connect(partial(self.reset_camera_slider, self.ui.slider_camera_zoom, 100))
-        self.ui.slider_camera_brightness.valueChanged.connect(partial(self.set_camera_prop_value, cv.CAP_PROP_BRIGHTNESS))
-        self.ui.push_camera_brightness_reset.clicked.connect(partial(self.reset_camera_slider, self.ui.slider_camera_brightness, 128))
-        self.ui.slider_camera_contrast.valueChanged.connect(partial(self.set_camera_prop_value, cv.CAP_PROP_CONTRAST))
-        self.ui.push_camera_contrast_reset.clicked.connect(partial(self.reset_camera_slider, self.ui.slider_camera_contrast, 128))
-        self.ui.slider_camera_gain.valueChanged.connect(partial(self.set_camera_prop_value, cv.CAP_PROP_GAIN))
-        self.ui.push_camera_gain_reset.clicked.connect(partial(self.reset_camera_slider, self.ui.slider_camera_gain, 128))
-        self.ui.slider_camera_saturation.valueChanged.connect(partial(self.set_camera_prop_value, cv.CAP_PROP_SATURATION))
-        self.ui.push_camera_saturation_reset.clicked.connect(partial(self.reset_camera_slider, self.ui.slider_camera_saturation, 128))
-        self.ui.slider_camera_sharpness.valueChanged.connect(partial(self.set_camera_prop_value, cv.CAP_PROP_SHARPNESS))
-        self.ui.push_camera_sharpness_reset.clicked.connect(partial(self.reset_camera_slider, self.ui.slider_camera_sharpness, 128))
+        for widget, property_id in (
+            (self.ui.spin_camera_exposure, cv.CAP_PROP_EXPOSURE),
+            (self.ui.slider_camera_focus, cv.CAP_PROP_FOCUS),
+            (self.ui.slider_camera_zoom, cv.CAP_PROP_ZOOM),
+            (self.ui.slider_camera_brightness, cv.CAP_PROP_BRIGHTNESS),
+            (self.ui.slider_camera_contrast, cv.CAP_PROP_CONTRAST),
+            (self.ui.slider_camera_gain, cv.CAP_PROP_GAIN),
+            (self.ui.slider_camera_saturation, cv.CAP_PROP_SATURATION),
+            (self.ui.slider_camera_sharpness, cv.CAP_PROP_SHARPNESS),
+        ):
+            widget.setProperty("cv_prop", property_id)
+            widget.valueChanged.connect(self.set_sender_camera_prop_value)
+            self._camera_prop_widgets_dict[property_id] = widget
+        for reset_button, property_id in (
+            (self.ui.push_camera_focus_reset, cv.CAP_PROP_FOCUS),
+            (self.ui.push_camera_zoom_reset, cv.CAP_PROP_ZOOM),
+            (self.ui.push_camera_brightness_reset, cv.CAP_PROP_BRIGHTNESS),
+            (self.ui.push_camera_contrast_reset, cv.CAP_PROP_CONTRAST),
+            (self.ui.push_camera_gain_reset, cv.CAP_PROP_GAIN),
+            (self.ui.push_camera_saturation_reset, cv.CAP_PROP_SATURATION),
+            (self.ui.push_camera_sharpness_reset, cv.CAP_PROP_SHARPNESS),
+        ):
+            reset_button.setProperty("cv_prop", property_id)
+            reset_button.clicked.connect(self.reset_sender_camera_slider)
         self.ui.combo_camera_fourcc.currentIndexChanged.connect(self.change_camera_fourcc)
+        for slider in (
+            self.ui.slider_camera_focus,
+            self.ui.slider_camera_zoom,
+            self.ui.slider_camera_brightness,
+            self.ui.slider_camera_contrast,
+            self.ui.slider_camera_gain,
+            self.ui.slider_camera_saturation,
+            self.ui.slider_camera_sharpness,
+        ):
+            slider.sliderPressed.connect(partial(self.set_dragging_camera_slider, True))
+            slider.sliderReleased.connect(partial(self.set_dragging_camera_slider, False))
 
         # Camera Calibration
         self.ui.push_calibration_image_top.clicked.connect(partial(self.trigger_calibration_image, "top"))
         self.ui.push_calibration_image_front.clicked.connect(partial(self.trigger_calibration_image, "front"))
         self.ui.push_calibration_image_side.clicked.connect(partial(self.trigger_calibration_image, "side"))
         self.ui.push_camera_calibrate.clicked.connect(self.calibrate)
+        self.core.camera_calibration_helper.calibration_finished.connect(self.calibration_finished)
         self.ui.push_camera_uncalibrate.clicked.connect(self.uncalibrate)
 
         # Snapshot
@@ -213,6 +280,22 @@ class MainWindow(QtWidgets.QMainWindow):
             traceback.print_exc()
         return super().closeEvent(a0)
 
+    def changeEvent(self, a0):
+        """Pause the refresh ticker while minimized unless the frames are needed for QR detection."""
+        if a0.type() == QtCore.QEvent.Type.WindowStateChange:
+            if self.isMinimized():
+                if not self.core.game_table.is_calibrated():
+                    self.pause_refresh_ticker()
+            elif self.core.camera_manager.get_camera() is not None:
+                self.start_refresh_ticker()
+        return super().changeEvent(a0)
+
+    def eventFilter(self, a0, a1):
+        """Keep track of the viewport scroll area height so the ticks don't have to query it."""
+        if a0 is self.ui.scroll_viewport and a1.type() == QtCore.QEvent.Type.Resize:
+            self._viewport_target_height = a1.size().height() - 20
+        return super().eventFilter(a0, a1)
+
     @QtCore.pyqtSlot()
     def close(self):
         """Close dialog."""
@@ -277,71 +360,111 @@ class MainWindow(QtWidgets.QMainWindow):
     #
     # #############################################
     def start_refresh_ticker(self):
-        """Start the ticker."""
-        self.core.refresh_ticker.stop()
-        self.core.refresh_ticker.start()
+        """Start the ticker if it's not already running."""
+        if not self.core.refresh_ticker.isActive():
+            self.core.refresh_ticker.start()
 
     def pause_refresh_ticker(self):
-        """Stop the ticker."""
-        self.core.refresh_ticker.stop()
+        """Stop the ticker if it's running."""
+        if self.core.refresh_ticker.isActive():
+            self.core.refresh_ticker.stop()
 
     @QtCore.pyqtSlot()
     def tick(self):
         """Refresh viewport."""
+        ui = self.ui
+        display_actual_resolution = ui.check_display_actual_resolution.isChecked()
+        fast_preview = self._is_dragging_camera_slider and not display_actual_resolution
         if self._in_calibration:
             image, info_str = self.core.get_image(
                 in_calibration=self._in_calibration,
-                number_of_squares_w=self.ui.spin_number_of_squares_w.value(),
-                number_of_squares_h=self.ui.spin_number_of_squares_h.value()
+                number_of_squares_w=ui.spin_number_of_squares_w.value(),
+                number_of_squares_h=ui.spin_number_of_squares_h.value(),
+                fast_preview=fast_preview
             )
         else:
-            image, info_str = self.core.get_image()
+            image, info_str = self.core.get_image(fast_preview=fast_preview)
 
         if image is None:
             return
 
         if info_str is not None:
-            self.ui.edit_camera_effective_resolution.setText(info_str)
+            ui.edit_camera_effective_resolution.setText(info_str)
 
         self.latest_image = image
 
+        # Nothing to display, frame was only grabbed for QR detection
+        if self.isMinimized() or not self.isVisible():
+            return
+
+        overlays_list = []
+
         # Table corners overlay
+        game_table = self.core.game_table
         current_camera = self.core.camera_manager.get_camera()
         is_calibrated = current_camera is not None and current_camera.is_calibrated()
         if is_calibrated and info_str is not None:
-            corners_overlay, corners_overlay_roi = self.core.game_table.get_camera_corners_overlay()
+            corners_overlay, corners_overlay_roi = game_table.get_camera_corners_overlay()
             if corners_overlay is not None:
-                image = common.composite_images(image, corners_overlay, corners_overlay_roi[0], corners_overlay_roi[1])
+                overlays_list.append((
+                    corners_overlay,
+                    corners_overlay_roi[0],
+                    corners_overlay_roi[1],
+                    QtGui.QPainter.CompositionMode.CompositionMode_SourceOver
+                ))
 
         # Debug
         if self._debug_overlay_needs_update and self._debug_data is not None:
-            self._debug_overlay = self.core.game_table.create_debug_overlay(debug_data=self._debug_data)
+            self._debug_overlay = game_table.create_debug_overlay(debug_data=self._debug_data)
             self._debug_overlay_needs_update = False
 
         if self._debug_overlay is not None:
-            roi = self.core.game_table.get_camera_roi()
+            roi = game_table.get_camera_roi()
             if roi is not None:
-                image = common.composite_images(
-                    image,
+                overlays_list.append((
                     self._debug_overlay,
                     roi[constants.ROI_MIN_X],
                     roi[constants.ROI_MIN_Y],
-                    composite_mode=QtGui.QPainter.CompositionMode.CompositionMode_Plus
-                )
+                    QtGui.QPainter.CompositionMode.CompositionMode_Plus
+                ))
 
-        if self.ui.check_display_actual_resolution.isChecked():
-            self.ui.label_viewport_image.resize(image.width(), image.height())
+        if overlays_list:
+            image = common.composite_overlays(image, overlays_list, image_result=self._composite_image)
+            self._composite_image = image
+
+        if display_actual_resolution:
+            target_height = None
         else:
-            image = image.scaledToHeight(self.ui.scroll_viewport.size().height() - 20)
+            target_height = self._viewport_target_height
+
+        # Same image as the one already displayed, like the "Please wait" frames or a throttled grab
+        viewport_image_key = (image.cacheKey(), target_height)
+        if viewport_image_key == self._viewport_image_key:
+            return
+        self._viewport_image_key = viewport_image_key
+
+        label_viewport_image = ui.label_viewport_image
+        if target_height is None:
+            if label_viewport_image.size() != image.size():
+                label_viewport_image.resize(image.size())
+        elif image.height() != target_height:
+            # Scale before the pixmap conversion so only the smaller image gets converted,
+            # the scaled image is written in a reused buffer that stays wrapped by the same QImage
+            target_width = max(1, round(image.width() * target_height / image.height()))
+            viewport_frame = common.resize_qimage_to_frame(image, target_width, target_height, frame_result=self._viewport_frame)
+            if viewport_frame is not self._viewport_frame or self._viewport_image.format() != image.format():
+                self._viewport_frame = viewport_frame
+                self._viewport_image = common.get_qimage_from_frame(viewport_frame, qimage_format=image.format())
+            image = self._viewport_image
 
         # Show image in viewport
-        self.ui.label_viewport_image.setPixmap(QtGui.QPixmap.fromImage(image))
-        self.ui.label_viewport_image.repaint()
+        # The image is already in a displayable format, skip the conversion pass
+        label_viewport_image.setPixmap(QtGui.QPixmap.fromImage(image, QtCore.Qt.ImageConversionFlag.NoFormatConversion))
 
-        time_delay = time.time() - self._previous_time
-        fps = 1.0 / max(0.0001, time_delay)
-        self._previous_time = time.time()
-        self.ui.edit_viewport_resolution.setText(f"{image.width()}x{image.height()} @ {fps:0.1f}")
+        current_time = time.time()
+        fps = 1.0 / max(0.0001, current_time - self._previous_time)
+        self._previous_time = current_time
+        ui.edit_viewport_resolution.setText(f"{image.width()}x{image.height()} @ {fps:0.1f}")
 
     # #############################################
     #
@@ -353,16 +476,31 @@ class MainWindow(QtWidgets.QMainWindow):
         current_camera = self.core.camera_manager.get_camera()
         is_calibrated = current_camera is not None and current_camera.is_calibrated()
         has_all_calibration_images = self.core.camera_calibration_helper.has_all_calibration_images()
-        self.ui.combo_camera_capture_resolution.setEnabled(not is_calibrated)
-        self.ui.slider_camera_focus.setEnabled(not is_calibrated)
-        self.ui.slider_camera_zoom.setEnabled(not is_calibrated)
-        self.ui.push_camera_calibrate.setEnabled(not is_calibrated and has_all_calibration_images)
-        self.ui.push_camera_calibrate.setText("Calibrated" if is_calibrated else "Calibrate")
-        self.ui.push_camera_uncalibrate.setEnabled(is_calibrated)
-        self.ui.push_calibration_image_top.setEnabled(not is_calibrated)
-        self.ui.push_calibration_image_front.setEnabled(not is_calibrated)
-        self.ui.push_calibration_image_side.setEnabled(not is_calibrated)
-        self.ui.combo_camera_device_id.setEnabled(not is_calibrated)
+        # Settings the calibration depends on are also locked while it's being computed
+        is_calibrating = self.core.camera_calibration_helper.is_calibrating()
+        is_locked = is_calibrated or is_calibrating
+        self.ui.combo_camera_capture_resolution.setEnabled(not is_locked)
+        self.ui.slider_camera_focus.setEnabled(not is_locked)
+        self.ui.slider_camera_zoom.setEnabled(not is_locked)
+        self.ui.push_camera_calibrate.setEnabled(not is_locked and has_all_calibration_images)
+        self.ui.push_camera_calibrate.setText("Calibrated" if is_calibrated else "Calibrating..." if is_calibrating else "Calibrate")
+        self.ui.push_camera_uncalibrate.setEnabled(is_calibrated and not is_calibrating)
+        # The calibration result is set on its camera once done, don't let it get replaced or deleted meanwhile
+        self.ui.push_load_camera.setEnabled(not is_calibrating)
+        self.ui.push_delete_camera.setEnabled(self._current_camera_item is not None and not is_calibrating)
+        self.ui.push_calibration_image_top.setEnabled(not is_locked)
+        self.ui.push_calibration_image_front.setEnabled(not is_locked)
+        self.ui.push_calibration_image_side.setEnabled(not is_locked)
+        self.ui.combo_camera_device_id.setEnabled(not is_locked)
+
+    @QtCore.pyqtSlot(bool)
+    def set_dragging_camera_slider(self, is_dragging):
+        """Set whether or not a camera property slider is being dragged, the viewport uses a fast preview meanwhile.
+
+        :param is_dragging: Whether a slider is being dragged.
+        :type is_dragging: bool
+        """
+        self._is_dragging_camera_slider = is_dragging
 
     @QtCore.pyqtSlot(QtWidgets.QSlider, int)
     def reset_camera_slider(self, slider, default_value):
@@ -376,16 +514,26 @@ class MainWindow(QtWidgets.QMainWindow):
         """
         slider.setValue(default_value)
 
+    @QtCore.pyqtSlot()
+    def reset_sender_camera_slider(self):
+        """Reset the slider of the reset button that emitted the signal to the default value of its camera property.
+
+            The button holds the cv.CAP_PROP_ value it resets in its "cv_prop" dynamic property.
+        """
+        property_id = self.sender().property("cv_prop")
+        self.reset_camera_slider(
+            self._camera_prop_widgets_dict[property_id],
+            constants.DEFAULT_CAPTURE_PROPERTIES_DICT.get(property_id, 0)
+        )
+
     def get_selected_device_id(self):
         """Get the device id of the selected camera.
 
         :return: The divice id or None if no selection.
         :rtype: int
         """
-        if self.ui.list_cameras.selectedItems():
-            camera_list_item = self.ui.list_cameras.selectedItems()[0]
-            if re_match_device_id := re.match("Camera ID: (?P<device_id>\\d+),", camera_list_item.text()):
-                return int(re_match_device_id.group("device_id"))
+        if (camera_item := self.get_current_camera_item()) is not None:
+            return camera_item.data(QtCore.Qt.ItemDataRole.UserRole)
 
         return None
 
@@ -402,15 +550,13 @@ class MainWindow(QtWidgets.QMainWindow):
     @QtCore.pyqtSlot()
     def set_viewport_to_selected(self):
         """Set the viewport to the selected camera in the list."""
+        self.flush_camera_prop_values()
         self.pause_refresh_ticker()
+        self._current_camera_item = self.get_current_camera_item()
         if (device_id := self.get_selected_device_id()) is not None:
             if self.core.camera_manager.set_current_camera(device_id):
                 self.start_refresh_ticker()
                 self.fill_current_camera_settings()
-
-            self.ui.push_delete_camera.setEnabled(True)
-        else:
-            self.ui.push_delete_camera.setEnabled(False)
         self.set_enabled_for_calibrations()
 
     @QtCore.pyqtSlot()
@@ -444,11 +590,36 @@ class MainWindow(QtWidgets.QMainWindow):
         new_camera = self.core.camera_manager.add_camera(device_id=device_id)
 
         # add to list
-        self.ui.list_cameras.addItem(f'Camera ID: {device_id}, "{new_camera.name}", "{new_camera.model_name}"')
+        self.add_camera_item(new_camera)
 
         # select the new camera item in list
         self.ui.list_cameras.setCurrentRow(self.ui.list_cameras.count() - 1)
 
+    def add_camera_item(self, new_camera):
+        """Add an item for a camera at the end of the cameras list.
+
+            The device id is stored in the item's user role data so it never has to be parsed back from the label.
+
+        :param new_camera: The camera.
+        :type new_camera: :class:`Camera`
+        """
+        camera_item = QtWidgets.QListWidgetItem()
+        self.set_camera_item(camera_item, new_camera)
+        self.ui.list_cameras.addItem(camera_item)
+
+    @staticmethod
+    def set_camera_item(camera_item, camera):
+        """Set the label and device id data of a camera item.
+
+        :param camera_item: The cameras list item.
+        :type camera_item: :class:`QListWidgetItem`
+
+        :param camera: The camera.
+        :type camera: :class:`Camera`
+        """
+        camera_item.setText(f'Camera ID: {camera.device_id}, "{camera.name}", "{camera.model_name}"')
+        camera_item.setData(QtCore.Qt.ItemDataRole.UserRole, camera.device_id)
+
     @QtCore.pyqtSlot()
     def delete_camera(self):
         """Delete the selected camera."""
@@ -457,10 +628,37 @@ class MainWindow(QtWidgets.QMainWindow):
             if (device_id := self.get_selected_device_id()) is not None:
                 self.core.camera_manager.delete_camera(device_id)
                 self.ui.list_cameras.takeItem(self.ui.list_cameras.currentRow())
+                # Removing the item doesn't always notify of a selection change
+                self._current_camera_item = self.get_current_camera_item()
         except Exception:
             traceback.print_exc()
         self.set_enabled_for_calibrations()
 
+    @staticmethod
+    def set_combo_items(combo, items_list, current_index=None):
+        """Replace all the items of a combo box without emitting any signal.
+
+            The items are only rebuilt if they differ from the current ones.
+
+        :param combo: The combo box.
+        :type combo: :class:`QComboBox`
+
+        :param items_list: The new items.
+        :type items_list: list[str]
+
+        :param current_index: The index to set as current or None to keep the default one. (None)
+        :type current_index: int
+        """
+        combo.blockSignals(True)
+        try:
+            if [combo.itemText(_i) for _i in range(combo.count())] != items_list:
+                combo.clear()
+                combo.addItems(items_list)
+            if current_index is not None:
+                combo.setCurrentIndex(current_index)
+        finally:
+            combo.blockSignals(False)
+
     def fill_current_camera_settings(self, default=False):
         """Fill current camera settings fields.
 
@@ -471,20 +669,27 @@ class MainWindow(QtWidgets.QMainWindow):
 
         if default:
             self.ui.edit_camera_name.setText("")
-            self.ui.combo_camera_device_id.clear()
-            self.ui.combo_camera_device_id.addItems(self.core.camera_manager.get_available_device_ids_list(as_list_of_str=True))
+            self.set_combo_items(
+                self.ui.combo_camera_device_id,
+                self.core.camera_manager.get_available_device_ids_list(as_list_of_str=True)
+            )
             self.ui.edit_camera_model_name.setText("")
 
         elif (current_camera := self.core.camera_manager.get_camera()) is not None:
-            self.ui.edit_camera_name.setText(current_camera.name)
-            self.ui.edit_camera_model_name.setText(current_camera.model_name)
+            # Only update the fields that changed, setting a text also resets the cursor and selection
+            if self.ui.edit_camera_name.text() != current_camera.name:
+                self.ui.edit_camera_name.setText(current_camera.name)
+            if self.ui.edit_camera_model_name.text() != current_camera.model_name:
+                self.ui.edit_camera_model_name.setText(current_camera.model_name)
             device_id_str = str(current_camera.device_id)
-            available_device_ids_list = sorted(set(self.core.camera_manager.get_available_device_ids_list(as_list_of_str=True) + [device_id_str]))
-            self.ui.combo_camera_device_id.clear()
-            self.ui.combo_camera_device_id.addItems(
-                available_device_ids_list
+            available_device_ids_list = [
+                str(_i) for _i in sorted({current_camera.device_id, *self.core.camera_manager.get_available_device_ids_list()})
+            ]
+            self.set_combo_items(
+                self.ui.combo_camera_device_id,
+                available_device_ids_list,
+                current_index=available_device_ids_list.index(device_id_str)
             )
-            self.ui.combo_camera_device_id.setCurrentIndex(available_device_ids_list.index(device_id_str))
             width = current_camera.get_capture_property(common.get_capture_property_id("Width"))
             height = current_camera.get_capture_property(common.get_capture_property_id("Height"))
             capture_resolution_str = f"{width}x{height}"
@@ -543,10 +748,24 @@ class MainWindow(QtWidgets.QMainWindow):
         self.core.camera_manager.set_current_camera_capture_resolution(int(width_str), int(height_str))
         self.start_refresh_ticker()
 
+    @QtCore.pyqtSlot(int)
+    def set_sender_camera_prop_value(self, value):
+        """Set the current camera property value from the widget that emitted the signal.
+
+            The widget holds the cv.CAP_PROP_ value it controls in its "cv_prop" dynamic property.
+
+        :param value: The value.
+        :type value: int
+        """
+        self.set_camera_prop_value(self.sender().property("cv_prop"), value)
+
     @QtCore.pyqtSlot(int, int)
     def set_camera_prop_value(self, property_id, value):
         """Set the current camera property value.
 
+        The value is only applied once the widget stopped changing for constants.CAMERA_PROPERTY_DEBOUNCE_INTERVAL ms,
+        this avoids updating the capture device for every intermediate value while dragging a slider.
+
         :param property_id: The cv.CAM_PROP_ value for this property.
         :type property_id: int
 
@@ -555,7 +774,30 @@ class MainWindow(QtWidgets.QMainWindow):
         """
         if self._disable_camera_settings_change:
             return
-        self.core.camera_manager.set_current_camera_prop_value(property_id, value)
+        self._pending_camera_prop_values_dict[property_id] = value
+        if (timer := self._camera_prop_timers_dict.get(property_id)) is None:
+            timer = QtCore.QTimer(self)
+            timer.setSingleShot(True)
+            timer.setInterval(constants.CAMERA_PROPERTY_DEBOUNCE_INTERVAL)
+            timer.timeout.connect(partial(self.apply_camera_prop_value, property_id))
+            self._camera_prop_timers_dict[property_id] = timer
+        timer.start()
+
+    @QtCore.pyqtSlot(int)
+    def apply_camera_prop_value(self, property_id):
+        """Apply the pending value of a property on the current camera.
+
+        :param property_id: The cv.CAM_PROP_ value for this property.
+        :type property_id: int
+        """
+        if (value := self._pending_camera_prop_values_dict.pop(property_id, None)) is not None:
+            self.core.camera_manager.set_current_camera_prop_value(property_id, value)
+
+    def flush_camera_prop_values(self):
+        """Apply all pending property values on the current camera right away."""
+        for property_id, timer in self._camera_prop_timers_dict.items():
+            timer.stop()
+            self.apply_camera_prop_value(property_id)
 
     @QtCore.pyqtSlot(int)
     def change_camera_fourcc(self, _):
@@ -564,13 +806,19 @@ class MainWindow(QtWidgets.QMainWindow):
             return
         self.core.camera_manager.set_current_camera_fourcc(self.ui.combo_camera_fourcc.currentText())
 
-    def update_current_camera_item_label(self):
-        """Update the current camera item's label."""
-        if (
-            (current_camera := self.core.camera_manager.get_camera()) is not None and
-            (camera_item := self.get_current_camera_item()) is not None
-        ):
-            camera_item.setText(f'Camera ID: {current_camera.device_id}, "{current_camera.name}", "{current_camera.model_name}"')
+    def update_current_camera_item_label(self, camera, camera_item=None):
+        """Update the current camera item's label.
+
+        :param camera: The current camera.
+        :type camera: :class:`Camera`
+
+        :param camera_item: The cameras list item or None to use the selected one. (None)
+        :type camera_item: :class:`QListWidgetItem`
+        """
+        if camera_item is None:
+            camera_item = self._current_camera_item
+        if camera_item is not None:
+            self.set_camera_item(camera_item, camera)
 
     @QtCore.pyqtSlot(str)
     def set_current_camera_name(self, name):
@@ -582,7 +830,7 @@ class MainWindow(QtWidgets.QMainWindow):
         if self._disable_camera_settings_change:
             return
         if self.core.camera_manager.set_current_camera_name(name):
-            self.update_current_camera_item_label()
+            self.update_current_camera_item_label(self.core.camera_manager.get_camera())
 
     @QtCore.pyqtSlot(str)
     def set_current_camera_model_name(self, model_name):
@@ -594,12 +842,13 @@ class MainWindow(QtWidgets.QMainWindow):
         if self._disable_camera_settings_change:
             return
         if self.core.camera_manager.set_current_camera_model_name(model_name):
-            self.update_current_camera_item_label()
+            self.update_current_camera_item_label(self.core.camera_manager.get_camera())
 
     @QtCore.pyqtSlot()
     def camera_save(self):
         """Save the current camera settings and calibration in the default calibration folder."""
         error_message = ""
+        self.flush_camera_prop_values()
         if (current_camera := self.core.camera_manager.get_camera()) is not None:
             try:
                 filepath = current_camera.get_save_filepath()
@@ -642,7 +891,7 @@ class MainWindow(QtWidgets.QMainWindow):
         camera_data['debug'] = False
         device_id = camera_data['device_id']
         current_camera = self.core.camera_manager.get_camera()
-        device_id_available = device_id in self.core.camera_manager.get_available_device_ids_list(as_list_of_str=False)
+        device_id_available = self.core.camera_manager.is_device_id_available(device_id)
         replace_camera = False
         if current_camera is not None:
             info_text = "Answering 'Yes' will load the camera settings and calibration using the current camera device id."
@@ -674,7 +923,7 @@ class MainWindow(QtWidgets.QMainWindow):
             new_camera = self.core.camera_manager.add_camera(**camera_data)
 
             # add to list
-            self.ui.list_cameras.addItem(f'Camera ID: {device_id}, "{new_camera.name}", "{new_camera.model_name}"')
+            self.add_camera_item(new_camera)
 
             # select the new camera item in list
             self.ui.list_cameras.setCurrentRow(self.ui.list_cameras.count() - 1)
@@ -690,12 +939,9 @@ class MainWindow(QtWidgets.QMainWindow):
         """
         if self._disable_camera_settings_change:
             return
-        device_id = int(device_id_str)
-        self.pause_refresh_ticker()
-        if self.core.camera_manager.set_current_camera_device_id(device_id):
-            self.update_current_camera_item_label()
-        if self.core.camera_manager.get_camera() is not None:
-            self.start_refresh_ticker()
+        # The refresh ticker runs in this thread, no need to pause it while the cameras dict is updated
+        if self.core.camera_manager.set_current_camera_device_id(int(device_id_str)):
+            self.update_current_camera_item_label(self.core.camera_manager.get_camera())
 
     # #############################################
     #
@@ -709,16 +955,26 @@ class MainWindow(QtWidgets.QMainWindow):
         if current_camera is None:
             print("No current camera")
             return
-        try:
-            mean_error = self.core.camera_calibration_helper.calibrate(
-                camera=current_camera,
-                number_of_squares_w=self.ui.spin_number_of_squares_w.value(),
-                number_of_squares_h=self.ui.spin_number_of_squares_h.value()
-            )
-            print(f"Calibration error: {mean_error}")
-        except Exception:
-            traceback.print_exc()
+        # The calibration takes a while, compute it in the background so the viewport keeps refreshing
+        self.core.camera_calibration_helper.calibrate_async(
+            camera=current_camera,
+            number_of_squares_w=self.ui.spin_number_of_squares_w.value(),
+            number_of_squares_h=self.ui.spin_number_of_squares_h.value()
+        )
+        self.set_enabled_for_calibrations()
+
+    @QtCore.pyqtSlot(bool, float)
+    def calibration_finished(self, is_success, rms_error):
+        """The camera calibration is done.
+
+        :param is_success: Whether or not the calibration succeeded.
+        :type is_success: bool
 
+        :param rms_error: The root mean square reprojection error.
+        :type rms_error: float
+        """
+        if is_success:
+            print(f"Calibration error: {rms_error}")
         self.set_enabled_for_calibrations()
 
     @QtCore.pyqtSlot()
@@ -756,14 +1012,12 @@ class MainWindow(QtWidgets.QMainWindow):
         if self.core.camera_calibration_helper.set_package(view_name):
             push_button = getattr(self.ui, f"push_calibration_image_{view_name}")
             push_button.setText("")
-            image = self.core.camera_calibration_helper.get_package_image(view_name)
-            pix = QtGui.QPixmap.fromImage(
-                image.scaled(
-                    push_button.width() - 10,
-                    push_button.height() - 10,
-                    aspectRatioMode=QtCore.Qt.AspectRatioMode.KeepAspectRatio
-                )
+            image = self.core.camera_calibration_helper.get_package_thumbnail(
+                view_name,
+                push_button.width() - 10,
+                push_button.height() - 10
             )
+            pix = QtGui.QPixmap.fromImage(image, QtCore.Qt.ImageConversionFlag.NoFormatConversion)
             push_button.setIcon(QtGui.QIcon(pix))
             push_button.setIconSize(pix.rect().size())
 
@@ -778,11 +1032,13 @@ class MainWindow(QtWidgets.QMainWindow):
     def snapshot_save(self):
         """Save the latest image to disk."""
         if self.latest_image is not None:
+            # Only needed for snapshots, no need to pay for it at import time
+            from datetime import datetime
             now = datetime.now()
             daystamp = now.strftime("%Y_%m_%d")
             timestamp = now.strftime("%Y_%m_%d_%H_%M_%S")
-            folder_name = re.sub("[^a-zA-Z0-9_]", "_", self.ui.edit_snapshot_folder_name.text().strip())
-            snapshot_name = re.sub("[^a-zA-Z0-9_]", "_", self.ui.edit_snapshot_name.text().strip())
+            folder_name = SNAPSHOT_NAME_INVALID_CHARS_REGEX.sub("_", self.ui.edit_snapshot_folder_name.text().strip())
+            snapshot_name = SNAPSHOT_NAME_INVALID_CHARS_REGEX.sub("_", self.ui.edit_snapshot_name.text().strip())
             snapshot_dir_path = common.get_saved_subdir('snapshot')
             add_timestamp_to_snapshot = self.ui.check_add_timestamp_to_snapshot.isChecked()
 
@@ -803,8 +1059,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
             file_path = f"{dir_path}/{file_name}.png"
 
-            if not os.path.exists(os.path.dirname(file_path)):
-                os.makedirs(os.path.dirname(file_path))
+            os.makedirs(dir_path, exist_ok=True)
 
             self.latest_image.save(file_path)
             print(f"Snapshot saved to: '{file_path}'")
@@ -1065,7 +1320,7 @@ class MainWindow(QtWidgets.QMainWindow):
     def set_voice_recognition_device_id(self, _=0):
         """Set the voice recognition device id."""
         self.stop_voice_recognition()
-        if re_result := re.match(VOICE_RECOGNITION_DEVICE_ID_REGEX, self.ui.combo_voice_device.currentText()):
+        if re_result := VOICE_RECOGNITION_DEVICE_ID_REGEX.match(self.ui.combo_voice_device.currentText()):
             self.core.voice_recognizer.set_device_id(int(re_result.group('device_id')))
 
     @QtCore.pyqtSlot(int)
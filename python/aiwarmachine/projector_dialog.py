@@ -19,7 +19,6 @@
 from functools import partial
 
 from PyQt6 import QtCore, QtWidgets, QtGui
-import numpy as np
 import cv2 as cv
 
 from . import viewport_label, constants, common
@@ -54,6 +53,9 @@ class ProjectorDialog(QtWidgets.QDialog):
         self._debug_data = None
         self._debug_overlay = None
 
+        # Reused between ticks to composite overlays over the base image
+        self._composite_image = None
+
         self._init_ui()
         self._init_connections()
         self.show()
@@ -189,11 +191,18 @@ class ProjectorDialog(QtWidgets.QDialog):
     def tick(self):
         """Refresh viewport."""
         image = self._base_image
+        overlays_list = []
+
         # Corners
         if self._corners_are_visible:
             corners_overlay, corners_overlay_roi = self.core.game_table.get_projector_corners_overlay(bold=self._borders_in_bold)
             if corners_overlay is not None:
-                image = common.composite_images(self._base_image, corners_overlay, corners_overlay_roi[constants.ROI_MIN_X], corners_overlay_roi[constants.ROI_MIN_Y])
+                overlays_list.append((
+                    corners_overlay,
+                    corners_overlay_roi[constants.ROI_MIN_X],
+                    corners_overlay_roi[constants.ROI_MIN_Y],
+                    QtGui.QPainter.CompositionMode.CompositionMode_SourceOver
+                ))
 
         # QR Detection
         if self._detection_overlay_needs_update and self._game_qr_detection_data is not None:
@@ -203,13 +212,12 @@ class ProjectorDialog(QtWidgets.QDialog):
         if self._qr_detection_overlay is not None:
             roi = self.core.game_table.get_projector_roi()
             if roi is not None:
-                image = common.composite_images(
-                    image,
+                overlays_list.append((
                     self._qr_detection_overlay,
                     roi[constants.ROI_MIN_X],
                     roi[constants.ROI_MIN_Y],
-                    composite_mode=QtGui.QPainter.CompositionMode.CompositionMode_Plus
-                )
+                    QtGui.QPainter.CompositionMode.CompositionMode_Plus
+                ))
 
         # Debug
         if self._debug_overlay_needs_update and self._debug_data is not None:
@@ -222,13 +230,16 @@ class ProjectorDialog(QtWidgets.QDialog):
         if self._debug_overlay is not None:
             roi = self.core.game_table.get_projector_roi()
             if roi is not None:
-                image = common.composite_images(
-                    image,
+                overlays_list.append((
                     self._debug_overlay,
                     roi[constants.ROI_MIN_X],
                     roi[constants.ROI_MIN_Y],
-                    composite_mode=QtGui.QPainter.CompositionMode.CompositionMode_Plus
-                )
+                    QtGui.QPainter.CompositionMode.CompositionMode_Plus
+                ))
+
+        if overlays_list:
+            image = common.composite_overlays(image, overlays_list, image_result=self._composite_image)
+            self._composite_image = image
 
         self.set_image(image)
 
@@ -239,7 +250,7 @@ class ProjectorDialog(QtWidgets.QDialog):
         :param image: The image.
         :type image: :class:`QImage`
         """
-        self.viewport_label.setPixmap(QtGui.QPixmap.fromImage(image))
+        self.viewport_label.setPixmap(QtGui.QPixmap.fromImage(image, QtCore.Qt.ImageConversionFlag.NoFormatConversion))
 
     # Debug
     @QtCore.pyqtSlot(dict)
@@ -256,10 +267,27 @@ class ProjectorDialog(QtWidgets.QDialog):
     # TODO: This should be moved to a different class as it depends of model base size.
     @QtCore.pyqtSlot(dict)
     def set_qr_detection_data(self, game_qr_detection_data):
-        """Notify of new qr detection data and prepare to create new overlay."""
+        """Notify of new qr detection data and prepare to create new overlay if positions changed."""
+        if (
+            self._game_qr_detection_data is not None and
+            self.get_qr_positions(game_qr_detection_data) == self.get_qr_positions(self._game_qr_detection_data)
+        ):
+            return
         self._game_qr_detection_data = game_qr_detection_data
         self._detection_overlay_needs_update = True
 
+    @staticmethod
+    def get_qr_positions(game_qr_detection_data):
+        """Get the drawn positions of qr detection data, ignoring other data like detection time.
+
+        :param game_qr_detection_data: The qr detection data.
+        :type game_qr_detection_data: dict
+
+        :return: The positions per qr message.
+        :rtype: dict
+        """
+        return {_qr_message: tuple(_qr_data['pos']) for _qr_message, _qr_data in game_qr_detection_data.items()}
+
     def create_game_qr_detection_overlay(self):
         """Create game overlay to composite in plus mode.
 
@@ -269,15 +297,7 @@ class ProjectorDialog(QtWidgets.QDialog):
         if not self.core.game_table.is_calibrated():
             return None
 
-        width, height = self.core.game_table.get_effective_table_image_size()
-        image = np.zeros(
-            (
-                height,
-                width,
-                3
-            ),
-            dtype=np.uint8
-        )
+        image = self.core.game_table.get_cleared_game_canvas()
         small_base_radius = self.core.game_table.convert_mm_to_pixel(15 + 3, rounded=True)
         thickness = self.core.game_table.convert_mm_to_pixel(2, ceiled=True)
 
@@ -286,15 +306,9 @@ class ProjectorDialog(QtWidgets.QDialog):
                 image,
                 qr_data['pos'],
                 small_base_radius,
-                (255, 255, 255),
+                constants.QR_DETECTION_OVERLAY_COLOR,
                 thickness
             )
 
         warped_image = self.core.game_table.warp_game_to_projector_image(image)
-        return QtGui.QImage(
-            warped_image,
-            warped_image.shape[1],
-            warped_image.shape[0],
-            warped_image.strides[0],
-            QtGui.QImage.Format.Format_BGR888
-        )
+        return common.get_qimage_from_frame(warped_image)
@@ -16,8 +16,11 @@
 #
 """QR detection object."""
 
+import collections
 import copy
+import threading
 import time
+import traceback
 
 import pyboof as pb
 import numpy as np
@@ -26,8 +29,11 @@ from PyQt6 import QtCore
 from . import constants
 
 
-class QRDetector(QtCore.QObject):
-    """Qr detector class to detect micro QR codes in image."""
+class QRDetector(QtCore.QThread):
+    """Qr detector class to detect micro QR codes in image.
+
+    Images are grabbed on each tick and detection is done in a separate thread, always working on the latest image.
+    """
 
     new_qr_detection_data = QtCore.pyqtSignal(dict)
 
@@ -37,12 +43,25 @@ class QRDetector(QtCore.QObject):
         self.core = core
         self._detector = pb.FactoryFiducial(np.uint8).microqr()
         self._detection_data = {}
+        self._detection_data_lock = threading.Lock()
+
+        self._pending_deque = collections.deque(maxlen=1)
+        self._condition = threading.Condition()
+        self._is_running = False
+        self._last_submitted_image = None
+        # Incremented on every reset, detections of images submitted before a reset are dropped
+        self._reset_count = 0
 
     @QtCore.pyqtSlot()
     def reset(self):
-        """Reset the latest data."""
-        self._detection_data = {}
-        self.new_qr_detection_data.emit(copy.deepcopy(self._detection_data))
+        """Reset the latest data and drop the images waiting for detection."""
+        with self._condition:
+            self._reset_count += 1
+            self._pending_deque.clear()
+        with self._detection_data_lock:
+            self._detection_data = {}
+        self._last_submitted_image = None
+        self.new_qr_detection_data.emit({})
 
     def update_detection_data(self, detection_data, epsilon=constants.QR_CENTER_EPISLON):
         """Update previous detection data with new detections and emit new_qr_detection_data signal with copy of data.
@@ -54,18 +73,21 @@ class QRDetector(QtCore.QObject):
         :type epsilon: float
         """
         has_changes = False
-        for qr_message, data in detection_data.items():
-            if qr_message not in self._detection_data:
-                has_changes = True
-                self._detection_data[qr_message] = data
-            else:
-                previous_x, previous_y = self._detection_data[qr_message]['pos']
-                new_x, new_y = data['pos']
-                if abs(previous_x - new_x) + abs(previous_y - new_y) > epsilon:
+        with self._detection_data_lock:
+            for qr_message, data in detection_data.items():
+                if qr_message not in self._detection_data:
                     has_changes = True
                     self._detection_data[qr_message] = data
+                else:
+                    previous_x, previous_y = self._detection_data[qr_message]['pos']
+                    new_x, new_y = data['pos']
+                    if abs(previous_x - new_x) + abs(previous_y - new_y) > epsilon:
+                        has_changes = True
+                        self._detection_data[qr_message] = data
+            if has_changes:
+                detection_data_copy = copy.deepcopy(self._detection_data)
         if has_changes:
-            self.new_qr_detection_data.emit(copy.deepcopy(self._detection_data))
+            self.new_qr_detection_data.emit(detection_data_copy)
 
     def detect(self, np_image):
         """Detect Micro QR codes in image.
@@ -73,50 +95,98 @@ class QRDetector(QtCore.QObject):
         :param np_image: Single band contiguous 3D array.
         :type np_image: :class:`NDArray`
 
-        :return: Game coordinates detections.
+        :return: Game coordinates detections or None if the table is no longer calibrated.
         :rtype: dict
         """
         image = pb.ndarray_to_boof(np_image)
         self._detector.detect(image)
-        detections = {}
+        qr_messages_list = []
+        centers_list = []
         for qr in self._detector.detections:
-            vertices_pos_list = []
-            sum_x, sum_y = 0.0, 0.0
-            num_vertices = len(qr.bounds.vertexes)
-            for vertex in qr.bounds.vertexes:
-                sum_x += vertex.x
-                sum_y += vertex.y
-                vertices_pos_list.append((vertex.x, vertex.y))
-            center_game_pos = self.core.game_table.warp_camera_position_to_game((sum_x / num_vertices, sum_y / num_vertices), rounded=True)
-            detections[qr.message] = {
-                'pos': center_game_pos,
-                'time': time.time()
+            vertexes = qr.bounds.vertexes
+            num_vertices = len(vertexes)
+            qr_messages_list.append(qr.message)
+            centers_list.append((
+                sum(_vertex.x for _vertex in vertexes) / num_vertices,
+                sum(_vertex.y for _vertex in vertexes) / num_vertices
+            ))
+
+        # The table can get uncalibrated from the GUI thread while detecting
+        if not self.core.game_table.is_calibrated():
+            return None
+
+        # Warp all centers in a single call, every detection of this image shares the same time
+        centers_game_pos_list = self.core.game_table.warp_camera_positions_to_game(centers_list, rounded=True)
+        if len(centers_game_pos_list) != len(centers_list):
+            return None
+        detection_time = time.time()
+        return {
+            _qr_message: {
+                'pos': _center_game_pos,
+                'time': detection_time
             }
-        return detections
+            for _qr_message, _center_game_pos in zip(qr_messages_list, centers_game_pos_list)
+        }
 
     @QtCore.pyqtSlot()
     def tick(self):
-        """Get the latest frame and to a detection on it."""
+        """Get the latest frame and submit it for detection."""
         if not self.core.game_table.is_calibrated():
             return
 
         roi = self.core.game_table.get_camera_roi()
 
         np_image, _ = self.core.get_image(simply_latest_np_image=True)
-        if np_image is None:
+        # No new frame since the last submission, detecting it again would give the same result
+        if np_image is None or np_image is self._last_submitted_image:
             return
-
-        detections = self.detect(
-            np.copy(
-                np_image[
-                    roi[constants.ROI_MIN_Y]:roi[constants.ROI_MAX_Y] + 1,
-                    roi[constants.ROI_MIN_X]:roi[constants.ROI_MAX_X] + 1,
-                    1
-                ]
-            )
+        self._last_submitted_image = np_image
+
+        if not self.isRunning():
+            self.start()
+
+        # Copy the green channel of the table area now, the frame buffer is reused by the following undistorted frames
+        np_image_roi = np.copy(
+            np_image[
+                roi[constants.ROI_MIN_Y]:roi[constants.ROI_MAX_Y] + 1,
+                roi[constants.ROI_MIN_X]:roi[constants.ROI_MAX_X] + 1,
+                1
+            ]
         )
 
-        self.update_detection_data(detections)
+        with self._condition:
+            self._pending_deque.append((self._reset_count, np_image_roi))
+            self._condition.notify()
+
+    def stop(self):
+        """Stop the thread from running.
+
+        When calling this method, you should also call wait() to make sure it stopped.
+        """
+        with self._condition:
+            self._is_running = False
+            self._pending_deque.clear()
+            self._condition.notify()
+        self._last_submitted_image = None
+
+    def run(self):
+        """Detect QR codes in submitted images and update detection data."""
+        self._is_running = True
+        while True:
+            with self._condition:
+                while self._is_running and not self._pending_deque:
+                    self._condition.wait()
+                if not self._is_running:
+                    break
+                reset_count, np_image_roi = self._pending_deque.popleft()
+
+            try:
+                detection_data = self.detect(np_image_roi)
+                # Drop detections of images submitted before a reset, their ROI and warp may no longer match
+                if detection_data is not None and reset_count == self._reset_count:
+                    self.update_detection_data(detection_data)
+            except Exception:
+                traceback.print_exc()
 
     # TODO: This should be moved to a different class as it depends of model base size.
     def query(self, pos, max_distance=30):
@@ -131,8 +201,9 @@ class QRDetector(QtCore.QObject):
         :return: QR message and position.
         :rtype: tuple[int, :class:`QPoint`]
         """
-        for qr_message, qr_data in self._detection_data.items():
-            if abs(pos[0] - qr_data['pos'][0]) + abs(pos[1] - qr_data['pos'][1]) <= max_distance:
-                return qr_message, qr_data['pos']
+        with self._detection_data_lock:
+            for qr_message, qr_data in self._detection_data.items():
+                if abs(pos[0] - qr_data['pos'][0]) + abs(pos[1] - qr_data['pos'][1]) <= max_distance:
+                    return qr_message, qr_data['pos']
 
         return None, None
@@ -94,11 +94,10 @@ class ViewportLabel(QtWidgets.QLabel):
         self.key_press_event.emit(event.text())
 
     def setPixmap(self, image, fixed_size=True):
-        """Set Pixmap"""
+        """Set Pixmap, the label schedules its own repaint."""
         if self.pix_size != image.size():
             self.pix_size = image.size()
             if fixed_size:
                 self.setFixedSize(self.pix_size)
 
         super().setPixmap(image)
-        self.repaint()